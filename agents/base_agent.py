@@ -1,34 +1,148 @@
 """Base agent class for EUNA MVP."""
 
+import copy
+import hashlib
+import json
 import logging
-from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Protocol, Sequence, runtime_checkable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Default capability to tool mapping used by get_preferred_tools
+_CAPABILITY_TOOL_MAPPING = MappingProxyType({
+    "web_search": ("web_search",),
+    "text_analysis": ("text_summarizer",),
+    "calculation": ("calculator",),
+    "data_processing": ("json_parser",),
+    "file_operations": ("file_reader",),
+    "scheduling": ("datetime_tool",),
+    "communication": ("http_request",)
+})
 
-class BaseAgent(ABC):
-    """Abstract base class for all agents in EUNA."""
+_MAX_TASK_INPUT = 100
+
+# Shared encoder; json.dumps(default=...) would build a new encoder per call
+_json_encoder = json.JSONEncoder(default=str)
+
+
+@lru_cache(maxsize=512)
+def _truncate(text: str, limit: int = _MAX_TASK_INPUT) -> str:
+    """Truncate text to limit characters, appending an ellipsis when cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _bound_payload(value: Any, limit: int) -> Any:
+    """Recursively cap string values in a tool payload at limit characters."""
+    if isinstance(value, str):
+        if len(value) > limit:
+            return f"{value[:limit]}...[+{len(value) - limit} chars]"
+        return value
+    if isinstance(value, dict):
+        return {k: _bound_payload(v, limit) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_bound_payload(v, limit) for v in value]
+    return value
+
+
+def _iso(ts: float) -> str:
+    """Format an epoch timestamp as an ISO 8601 string."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionRecord:
+    """Compact record of a single agent execution."""
+    
+    timestamp: float
+    task_input: str
+    success: bool
+    tools_used: tuple
+    confidence: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to dictionary."""
+        return {
+            "timestamp": _iso(self.timestamp),
+            "task_input": self.task_input,
+            "success": self.success,
+            "tools_used": list(self.tools_used),
+            "confidence": self.confidence
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ToolResultRecord:
+    """Compact record of a single tool execution result."""
+    
+    tool_name: str
+    result: Dict[str, Any]
+    timestamp: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to dictionary."""
+        return {
+            "tool_name": self.tool_name,
+            "result": self.result,
+            "timestamp": _iso(self.timestamp)
+        }
+
+
+@runtime_checkable
+class AgentProtocol(Protocol):
+    """Structural interface for agents, including third-party duck-typed ones."""
+    
+    agent_id: int
+    name: str
+    
+    async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        ...
     
-    def __init__(self, agent_id: int, name: str, role: str, capabilities: List[str]):
+    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        ...
+
+
+class BaseAgent:
+    """Base class for all agents in EUNA; subclasses implement execute and plan_actions."""
+    
+    __slots__ = (
+        "agent_id", "name", "role", "capabilities", "_capability_set",
+        "status", "created_at", "execution_history", "_preferred_tools_cache",
+        "_result_cache"
+    )
+    
+    # Capability to tool mapping; subclasses may assign their own
+    _CAPABILITY_TOOL_MAPPING = _CAPABILITY_TOOL_MAPPING
+    
+    # Bounds of the successful results kept per agent for repeated inputs
+    RESULT_CACHE_SIZE = 256
+    RESULT_CACHE_TTL = 300.0
+    
+    def __init__(self, agent_id: int, name: str, role: str, capabilities: Sequence[str]):
         self.agent_id = agent_id
         self.name = name
         self.role = role
-        self.capabilities = capabilities
+        self.capabilities = tuple(capabilities)  # Shared as-is when already a tuple
+        self._capability_set = frozenset(capabilities)
         self.status = "initialized"
         self.created_at = datetime.now()
-        self.execution_history: List[Dict[str, Any]] = []
+        self.execution_history: deque = deque(maxlen=10)  # Keep only last 10 executions
+        self._preferred_tools_cache: Optional[List[str]] = None
+        self._result_cache: Optional[OrderedDict] = None  # key -> (expires_at, result)
     
-    @abstractmethod
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the agent's main functionality."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Plan the actions needed to complete the task."""
-        pass
+        raise NotImplementedError
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
@@ -44,74 +158,174 @@ class BaseAgent(ABC):
     
     def log_execution(self, task_input: str, result: Dict[str, Any]):
         """Log execution for history tracking."""
-        execution_record = {
-            "timestamp": datetime.now().isoformat(),
-            "task_input": task_input[:100] + "..." if len(task_input) > 100 else task_input,
-            "success": result.get("success", False),
-            "tools_used": result.get("tools_used", []),
-            "confidence": result.get("confidence_level", "medium")
-        }
-        self.execution_history.append(execution_record)
+        success = result.get("success", False)
+        tools_used = result.get("tools_used", ())
+        confidence = result.get("confidence_level", "medium")
+        self.execution_history.append(
+            ExecutionRecord(time.time(), _truncate(task_input), success, tuple(tools_used), confidence)
+        )
+    
+    def get_execution_history(self) -> List[Dict[str, Any]]:
+        """Get a list snapshot of recent executions."""
+        return [record.to_dict() for record in self.execution_history]
+    
+    @staticmethod
+    def _result_cache_key(task_input: str) -> bytes:
+        """Fingerprint a task input for the result cache."""
+        return hashlib.blake2b(task_input.strip().encode(), digest_size=16).digest()
+    
+    def get_cached_result(self, task_input: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for task_input, or None on a miss."""
+        cache = self._result_cache
+        if not cache:
+            return None
+        
+        key = self._result_cache_key(task_input)
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del cache[key]
+            return None
+        
+        cache.move_to_end(key)
+        # Deep copy: results nest lists and dicts that callers may mutate
+        result = copy.deepcopy(cached[1])
+        result["execution_time"] = 0.0
+        return result
+    
+    def cache_result(self, task_input: str, result: Dict[str, Any]):
+        """Remember a successful result so a repeated input can skip execution."""
+        if not result.get("success"):
+            return
         
-        # Keep only last 10 executions
-        if len(self.execution_history) > 10:
-            self.execution_history = self.execution_history[-10:]
+        if self._result_cache is None:
+            self._result_cache = OrderedDict()
+        cache = self._result_cache
+        key = self._result_cache_key(task_input)
+        cache[key] = (
+            time.monotonic() + self.RESULT_CACHE_TTL,
+            copy.deepcopy({k: v for k, v in result.items() if k != "execution_time"})
+        )
+        cache.move_to_end(key)
+        if len(cache) > self.RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
     
     def can_handle_capability(self, capability: str) -> bool:
         """Check if agent can handle a specific capability."""
-        return capability in self.capabilities
+        return capability in self._capability_set
     
     def get_preferred_tools(self) -> List[str]:
         """Get list of preferred tools for this agent type."""
         # Default implementation - can be overridden by subclasses
-        capability_tool_mapping = {
-            "web_search": ["web_search"],
-            "text_analysis": ["text_summarizer"],
-            "calculation": ["calculator"],
-            "data_processing": ["json_parser"],
-            "file_operations": ["file_reader"],
-            "scheduling": ["datetime_tool"],
-            "communication": ["http_request"]
-        }
+        if self._preferred_tools_cache is None:
+            mapping_get = type(self)._CAPABILITY_TOOL_MAPPING.get
+            preferred_tools = []
+            seen = set()
+            seen_add = seen.add
+            for capability in self.capabilities:
+                for tool in mapping_get(capability, ()):
+                    if tool not in seen:
+                        seen_add(tool)
+                        preferred_tools.append(tool)
+            self._preferred_tools_cache = preferred_tools
         
-        preferred_tools = []
-        for capability in self.capabilities:
-            if capability in capability_tool_mapping:
-                preferred_tools.extend(capability_tool_mapping[capability])
-        
-        return list(set(preferred_tools))  # Remove duplicates
+        return self._preferred_tools_cache
 
 
 class AgentExecutionContext:
-    """Context object for agent execution."""
+    """Context object for agent execution.
+    
+    Append operations on tool_results are atomic; readers must snapshot
+    via list(self.tool_results or ()) before iterating. Both result
+    containers stay None until the first write.
+    """
+    
+    __slots__ = (
+        "task_id", "user_input", "session_context", "execution_start",
+        "_execution_start_monotonic", "intermediate_results", "tool_results",
+        "_summarizer"
+    )
+    
+    # Maximum characters kept per string field of a stored tool result
+    MAX_TOOL_RESULT_CHARS = 4096
+    
+    # Freelist of released contexts reused by acquire()
+    _pool: List["AgentExecutionContext"] = []
+    _POOL_MAX = 1024
     
-    def __init__(self, task_id: int, user_input: str, session_context: Optional[Dict] = None):
+    def __init__(self, task_id: int, user_input: str, session_context: Optional[Dict] = None,
+                 summarizer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        self._reset(task_id, user_input, session_context, summarizer)
+    
+    def _reset(self, task_id: int, user_input: str, session_context: Optional[Dict] = None,
+               summarizer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        """(Re)initialize all per-execution state."""
         self.task_id = task_id
         self.user_input = user_input
         self.session_context = session_context or {}
         self.execution_start = datetime.now()
-        self.intermediate_results: Dict[str, Any] = {}
-        self.tool_results: List[Dict[str, Any]] = []
+        self._execution_start_monotonic = time.monotonic()
+        # Rebind rather than clear() so dicts handed out by to_dict stay intact
+        self.intermediate_results: Optional[Dict[str, Any]] = None
+        self.tool_results: Optional[List[ToolResultRecord]] = None
+        self._summarizer = summarizer
+    
+    @classmethod
+    def acquire(cls, task_id: int, user_input: str, session_context: Optional[Dict] = None,
+                summarizer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> "AgentExecutionContext":
+        """Get a context from the freelist, or a new one if it is empty."""
+        try:
+            ctx = cls._pool.pop()
+        except IndexError:
+            return cls(task_id, user_input, session_context, summarizer)
+        ctx._reset(task_id, user_input, session_context, summarizer)
+        return ctx
+    
+    @classmethod
+    def release(cls, ctx: "AgentExecutionContext"):
+        """Return a context to the freelist; it must not be used afterwards."""
+        if len(cls._pool) < cls._POOL_MAX:
+            ctx.session_context = None
+            ctx.intermediate_results = None
+            ctx.tool_results = None
+            ctx._summarizer = None
+            cls._pool.append(ctx)
+    
+    @classmethod
+    @asynccontextmanager
+    async def scoped(cls, task_id: int, user_input: str, session_context: Optional[Dict] = None,
+                     summarizer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        """Acquire a pooled context for the duration of an async with block."""
+        ctx = cls.acquire(task_id, user_input, session_context, summarizer)
+        try:
+            yield ctx
+        finally:
+            cls.release(ctx)
     
     def add_intermediate_result(self, key: str, value: Any):
         """Add intermediate result for use by other agents."""
+        if self.intermediate_results is None:
+            self.intermediate_results = {}
         self.intermediate_results[key] = value
     
     def get_intermediate_result(self, key: str, default: Any = None) -> Any:
         """Get intermediate result from previous processing."""
-        return self.intermediate_results.get(key, default)
+        return (self.intermediate_results or {}).get(key, default)
     
-    def add_tool_result(self, tool_name: str, result: Dict[str, Any]):
-        """Add tool execution result."""
-        self.tool_results.append({
-            "tool_name": tool_name,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        })
+    def add_tool_result(self, tool_name: str, result: Dict[str, Any], keep_full: bool = False):
+        """Add tool execution result, bounding its size unless keep_full is set."""
+        if not keep_full:
+            if self._summarizer is not None:
+                result = self._summarizer(result)
+            result = _bound_payload(result, self.MAX_TOOL_RESULT_CHARS)
+        if self.tool_results is None:
+            self.tool_results = []
+        self.tool_results.append(ToolResultRecord(tool_name, result, time.time()))
     
     def get_execution_duration(self) -> float:
         """Get execution duration in seconds."""
-        return (datetime.now() - self.execution_start).total_seconds()
+        return time.monotonic() - self._execution_start_monotonic
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert context to dictionary."""
@@ -120,7 +334,34 @@ class AgentExecutionContext:
             "user_input": self.user_input,
             "session_context": self.session_context,
             "execution_start": self.execution_start.isoformat(),
-            "intermediate_results": self.intermediate_results,
-            "tool_results": self.tool_results,
+            "intermediate_results": self.intermediate_results or {},
+            "tool_results": [record.to_dict() for record in self.tool_results or ()],
             "execution_duration": self.get_execution_duration()
         }
+    
+    def to_json(self) -> str:
+        """Serialize context to a JSON string.
+        
+        Tool results are encoded straight from their records rather than
+        through an intermediate to_dict() of the whole context.
+        """
+        parts = [
+            '{"task_id": ', _json_encoder.encode(self.task_id),
+            ', "user_input": ', _json_encoder.encode(self.user_input),
+            ', "session_context": ', _json_encoder.encode(self.session_context),
+            ', "execution_start": ', _json_encoder.encode(self.execution_start.isoformat()),
+            ', "intermediate_results": ', _json_encoder.encode(self.intermediate_results or {}),
+            ', "tool_results": ['
+        ]
+        for i, record in enumerate(self.tool_results or ()):
+            parts.append(', {"tool_name": ' if i else '{"tool_name": ')
+            parts.append(_json_encoder.encode(record.tool_name))
+            parts.append(', "result": ')
+            parts.append(_json_encoder.encode(record.result))
+            parts.append(', "timestamp": ')
+            parts.append(_json_encoder.encode(_iso(record.timestamp)))
+            parts.append('}')
+        parts.append('], "execution_duration": ')
+        parts.append(_json_encoder.encode(self.get_execution_duration()))
+        parts.append('}')
+        return "".join(parts)
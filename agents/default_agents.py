@@ -1,277 +1,470 @@
 """Default agent implementations for EUNA MVP."""
 
 import logging
-from typing import Dict, List, Any, Optional
+import re
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping, Sequence
 
 from agents.base_agent import BaseAgent, AgentExecutionContext
 from tools.tool_executor import tool_executor
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by the agents' parsing helpers
+_SENT_FINDITER = re.compile(r'[^.!?]+')
+_CODE_BLOCK = re.compile(r'```[\w]*\n(.*?)\n```', re.DOTALL)
+_INLINE_CODE = re.compile(r'`([^`]+)`')
+# Keyword tables; matching is by substring, as in the original list scans
+_KEY_IND_RE = re.compile(
+    r'important|key|main|primary|essential|critical|significant|major|crucial|vital|fundamental',
+    re.IGNORECASE
+)
+_ORDINAL_PREFIXES = ("First", "Second", "Third", "Finally", "In conclusion")
+# Alternatives are tried in order, like the old startswith loop
+_QUERY_PREFIX_RE = re.compile(
+    r'^(?:search for|find|look up|research|tell me about'
+    r'|what is|who is|where is|when is|how to)\s*'
+)
+_STRIP_PUNCT = str.maketrans("", "", "?!")
+_LANGUAGES = ("python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby")
+_GEN_RE = re.compile(r'generate|create|write|build|implement', re.IGNORECASE)
+_REV_RE = re.compile(r'review|check|analyze|audit', re.IGNORECASE)
+_DBG_RE = re.compile(r'debug|fix|error|bug|issue', re.IGNORECASE)
+# Scheduling cues in one pass; lookaheads keep matches from consuming each other
+_SCHEDULE_RE = re.compile(
+    r'(?=(?P<duration>(?P<amount>\d+)\s*(?P<unit>hour|minute|day|week)s?))'
+    r'|(?=(?P<deadline>(?:by|before|until)\s+(?P<due>\w+)))'
+    r'|(?=(?P<urgent>urgent|asap|immediately))'
+    r'|(?=(?P<later>later|eventually|when possible))'
+)
+# Relevance cues; case-insensitive substring matches, as the lowered list scans were
+_AUTH_RE = re.compile(r'wikipedia\.org|gov|edu|stackoverflow\.com', re.IGNORECASE)
+_RECENT_RE = re.compile(r'2024|2023|recent|latest|new', re.IGNORECASE)
+_COMPREH_RE = re.compile(r'guide|tutorial|complete|comprehensive', re.IGNORECASE)
+# Source classification; anchored lookaheads keep the category priority order
+_SOURCE_RE = re.compile(
+    r'(?=.*?wikipedia\.org)(?P<encyclopedia>)'
+    r'|(?=.*?\.(?:gov|edu))(?P<official>)'
+    r'|(?=.*?stackoverflow\.com)(?P<technical>)'
+    r'|(?=.*?(?:news|reuters|bbc|cnn))(?P<news>)'
+    r'|(?=.*?blog)(?P<blog>)',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _freeze_actions(*actions: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
+    """Wrap a constant action plan as a tuple of read-only mappings."""
+    
+    return tuple(MappingProxyType(action) for action in actions)
+
+
+# Agent identities, shared by every instance of each default agent
+_SUMMARIZER_META = MappingProxyType({
+    "name": "SummarizerAgent",
+    "role": "Text summarization and key point extraction specialist",
+    "capabilities": ("text_analysis", "summarization", "key_extraction", "content_organization")
+})
+_SEARCH_META = MappingProxyType({
+    "name": "SearchAgent",
+    "role": "Web search and information gathering specialist",
+    "capabilities": ("web_search", "information_gathering", "fact_checking", "research")
+})
+_CODING_META = MappingProxyType({
+    "name": "CodingAgent",
+    "role": "Code generation, review, and debugging specialist",
+    "capabilities": ("code_generation", "code_review", "debugging", "syntax_checking", "documentation")
+})
+_SCHEDULER_META = MappingProxyType({
+    "name": "SchedulerAgent",
+    "role": "Task scheduling and time management specialist",
+    "capabilities": ("scheduling", "time_management", "calendar_operations", "deadline_tracking")
+})
+
+
+# Failure payload shared by every agent; copying the template clones its key table
+# instead of rebuilding the dict from scratch on each error path
+_FAILURE_RESULT_KEYS = tuple(map(sys.intern, ("success", "agent_name", "error", "tools_used", "confidence_level")))
+_FAILURE_RESULT = dict.fromkeys(_FAILURE_RESULT_KEYS)
+_FAILURE_RESULT.update(success=False, confidence_level="low")
+
+
+def _failure_result(agent_name: str, error: BaseException) -> Dict[str, Any]:
+    """Build the result returned when an agent's execution fails."""
+    
+    result = _FAILURE_RESULT.copy()
+    result["agent_name"] = agent_name
+    result["error"] = str(error)
+    result["tools_used"] = []
+    return result
+
+
+# Static action plans returned by plan_actions; shared across calls, so read-only
+_SUMMARIZER_ACTIONS = _freeze_actions(
+    {
+        "action": "analyze_text",
+        "description": "Analyze text structure and content",
+        "tool": "text_summarizer",
+        "priority": "high"
+    },
+    {
+        "action": "extract_key_points",
+        "description": "Extract main themes and important points",
+        "tool": "internal_processing",
+        "priority": "medium"
+    },
+    {
+        "action": "create_summary",
+        "description": "Generate concise summary",
+        "tool": "text_summarizer",
+        "priority": "high"
+    }
+)
+_SEARCH_ACTIONS = _freeze_actions(
+    {
+        "action": "extract_search_terms",
+        "description": "Extract relevant search terms from input",
+        "tool": "internal_processing",
+        "priority": "high"
+    },
+    {
+        "action": "web_search",
+        "description": "Search the web for relevant information",
+        "tool": "web_search",
+        "priority": "high"
+    },
+    {
+        "action": "process_results",
+        "description": "Process and organize search results",
+        "tool": "internal_processing",
+        "priority": "medium"
+    }
+)
+_SCHEDULER_ACTIONS = _freeze_actions(
+    {
+        "action": "get_current_time",
+        "description": "Get current date and time",
+        "tool": "datetime_tool",
+        "priority": "high"
+    },
+    {
+        "action": "parse_schedule_request",
+        "description": "Parse scheduling requirements",
+        "tool": "internal_processing",
+        "priority": "high"
+    },
+    {
+        "action": "create_schedule",
+        "description": "Create optimized schedule",
+        "tool": "internal_processing",
+        "priority": "medium"
+    }
+)
+_CODING_GEN_ACTIONS = _freeze_actions(
+    {"action": "analyze_requirements", "tool": "internal_processing", "priority": "high"},
+    {"action": "design_solution", "tool": "internal_processing", "priority": "high"},
+    {"action": "generate_code", "tool": "internal_processing", "priority": "high"},
+    {"action": "validate_syntax", "tool": "internal_processing", "priority": "medium"}
+)
+_CODING_REVIEW_ACTIONS = _freeze_actions(
+    {"action": "read_code", "tool": "file_reader", "priority": "high"},
+    {"action": "analyze_code", "tool": "internal_processing", "priority": "high"},
+    {"action": "check_best_practices", "tool": "internal_processing", "priority": "medium"}
+)
+_CODING_DEFAULT_ACTIONS = _freeze_actions(
+    {"action": "understand_problem", "tool": "internal_processing", "priority": "high"},
+    {"action": "research_solution", "tool": "web_search", "priority": "medium"},
+    {"action": "provide_solution", "tool": "internal_processing", "priority": "high"}
+)
+
+
+# Code templates returned by CodingAgent._generate_code_template
+_GENERATED_CODE_TEMPLATES = {
+    "python": '''def example_function():
+    """
+    Example function implementation.
+    Modify according to your specific requirements.
+    """
+    # TODO: Implement your logic here
+    pass
+
+# Example usage
+if __name__ == "__main__":
+    result = example_function()
+    print(result)''',
+    "javascript": '''function exampleFunction() {
+    /**
+     * Example function implementation.
+     * Modify according to your specific requirements.
+     */
+    // TODO: Implement your logic here
+    return null;
+}
+
+// Example usage
+const result = exampleFunction();
+console.log(result);'''
+}
+
+
+@lru_cache(maxsize=32)
+def _default_template(language: str) -> str:
+    """Placeholder template for languages without a dedicated one."""
+    
+    return f"// {language} code template\n// TODO: Implement your solution here"
+
+
+def _trunc(text: str, limit: int = 80) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Pure string helpers; task inputs and result URLs recur, so results are memoized
+@lru_cache(maxsize=4096)
+def _search_query(task_input: str) -> str:
+    """Extract search query from task input."""
+    
+    # Remove common task prefixes
+    query = _QUERY_PREFIX_RE.sub("", task_input.lower(), count=1)
+    
+    # Clean up query
+    query = query.translate(_STRIP_PUNCT).strip()
+    
+    return query if query else task_input
+
+
+@lru_cache(maxsize=8192)
+def _source_type(url: str) -> str:
+    """Determine the type of source based on URL."""
+    
+    match = _SOURCE_RE.match(url)
+    return match.lastgroup if match else "general"
+
+
+@lru_cache(maxsize=4096)
+def _task_type(task_input: str) -> str:
+    """Determine the type of coding task."""
+    
+    if _GEN_RE.search(task_input):
+        return "generation"
+    elif _REV_RE.search(task_input):
+        return "review"
+    elif _DBG_RE.search(task_input):
+        return "debugging"
+    else:
+        return "general"
+
+
+@lru_cache(maxsize=4096)
+def _programming_language(task_input: str) -> str:
+    """Extract programming language from task input."""
+    
+    task_lower = task_input.lower()
+    
+    # Table order decides ties, so this stays a scan rather than a leftmost regex match
+    for lang in _LANGUAGES:
+        if lang in task_lower:
+            return lang
+    
+    return "python"  # Default
+
 
 class SummarizerAgent(BaseAgent):
     """Agent specialized in text summarization and key point extraction."""
     
+    __slots__ = ()
+    
     def __init__(self, agent_id: int):
-        super().__init__(
-            agent_id=agent_id,
-            name="SummarizerAgent",
-            role="Text summarization and key point extraction specialist",
-            capabilities=["text_analysis", "summarization", "key_extraction", "content_organization"]
-        )
+        super().__init__(agent_id=agent_id, **_SUMMARIZER_META)
     
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute summarization task."""
         
+        cached = self.get_cached_result(task_input)
+        if cached is not None:
+            self.status = "completed"
+            self.log_execution(task_input, cached)
+            return cached
+        
         self.status = "active"
-        execution_context = AgentExecutionContext(
+        async with AgentExecutionContext.scoped(
             task_id=context.get("task_id", 0),
             user_input=task_input,
             session_context=context
-        )
-        
-        try:
-            # Plan actions
-            actions = await self.plan_actions(task_input, context)
-            
-            # Execute text summarization
-            summary_result = await tool_executor.execute_single_tool(
-                agent_id=self.agent_id,
-                tool_name="text_summarizer",
-                parameters={"text": task_input, "max_sentences": 3}
-            )
-            
-            execution_context.add_tool_result("text_summarizer", summary_result)
-            
-            # Extract key points (simple implementation)
-            key_points = self._extract_key_points(task_input)
-            
-            # Compile result
-            result = {
-                "success": summary_result.get("success", False),
-                "agent_name": self.name,
-                "summary": summary_result.get("result", {}).get("summary", ""),
-                "key_points": key_points,
-                "original_length": len(task_input),
-                "summary_length": len(summary_result.get("result", {}).get("summary", "")),
-                "compression_ratio": summary_result.get("result", {}).get("compression_ratio", 0),
-                "tools_used": ["text_summarizer"],
-                "confidence_level": "high" if summary_result.get("success") else "low",
-                "execution_time": execution_context.get_execution_duration()
-            }
-            
-            self.status = "completed"
-            self.log_execution(task_input, result)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"SummarizerAgent execution error: {e}")
-            self.status = "failed"
-            
-            result = {
-                "success": False,
-                "agent_name": self.name,
-                "error": str(e),
-                "tools_used": [],
-                "confidence_level": "low"
-            }
-            
-            self.log_execution(task_input, result)
-            return result
-    
-    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        ) as execution_context:
+            try:
+                # Plan actions
+                actions = await self.plan_actions(task_input, context)
+                
+                # Execute text summarization
+                summary_result = await tool_executor.execute_single_tool(
+                    agent_id=self.agent_id,
+                    tool_name="text_summarizer",
+                    parameters={"text": task_input, "max_sentences": 3}
+                )
+                
+                execution_context.add_tool_result("text_summarizer", summary_result)
+                
+                # Extract key points (simple implementation)
+                key_points = self._extract_key_points(task_input)
+                
+                summary_data = summary_result.get("result") or {}
+                summary = summary_data.get("summary", "")
+                
+                # Compile result
+                result = {
+                    "success": summary_result.get("success", False),
+                    "agent_name": self.name,
+                    "summary": summary,
+                    "key_points": key_points,
+                    "original_length": len(task_input),
+                    "summary_length": len(summary),
+                    "compression_ratio": summary_data.get("compression_ratio", 0),
+                    "tools_used": ["text_summarizer"],
+                    "confidence_level": "high" if summary_result.get("success") else "low",
+                    "execution_time": execution_context.get_execution_duration()
+                }
+                
+                self.status = "completed"
+                self.log_execution(task_input, result)
+                self.cache_result(task_input, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"SummarizerAgent execution error: {e}")
+                self.status = "failed"
+                
+                result = _failure_result(self.name, e)
+                
+                self.log_execution(task_input, result)
+                return result
+    
+    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
         """Plan summarization actions."""
         
-        actions = [
-            {
-                "action": "analyze_text",
-                "description": "Analyze text structure and content",
-                "tool": "text_summarizer",
-                "priority": "high"
-            },
-            {
-                "action": "extract_key_points",
-                "description": "Extract main themes and important points",
-                "tool": "internal_processing",
-                "priority": "medium"
-            },
-            {
-                "action": "create_summary",
-                "description": "Generate concise summary",
-                "tool": "text_summarizer",
-                "priority": "high"
-            }
-        ]
-        
-        return actions
+        return _SUMMARIZER_ACTIONS
     
     def _extract_key_points(self, text: str) -> List[str]:
         """Extract key points from text (simplified implementation)."""
         
-        # Simple key point extraction based on sentence patterns
-        import re
-        
-        sentences = re.split(r'[.!?]+', text)
+        # Locate every key indicator in one pass; indicators never span a sentence break
+        indicator_hits = [hit.start() for hit in _KEY_IND_RE.finditer(text)]
         key_points = []
+        fallback = []
         
-        # Look for sentences with key indicators
-        key_indicators = [
-            "important", "key", "main", "primary", "essential", "critical",
-            "significant", "major", "crucial", "vital", "fundamental"
-        ]
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for index, match in enumerate(_SENT_FINDITER.finditer(text)):
+            sentence = match.group().strip()
             if len(sentence) > 20:  # Minimum length
-                if any(indicator in sentence.lower() for indicator in key_indicators):
-                    key_points.append(sentence)
-                elif sentence.startswith(("First", "Second", "Third", "Finally", "In conclusion")):
+                # Look for sentences with key indicators
+                hit = bisect_left(indicator_hits, match.start())
+                has_indicator = hit < len(indicator_hits) and indicator_hits[hit] < match.end()
+                if has_indicator or sentence.startswith(_ORDINAL_PREFIXES):
                     key_points.append(sentence)
+                    if len(key_points) == 5:  # Limit to 5 key points
+                        break
+                elif index < 3:
+                    fallback.append(sentence)
         
         # If no key points found, take first few sentences
-        if not key_points:
-            key_points = [s.strip() for s in sentences[:3] if s.strip() and len(s.strip()) > 20]
-        
-        return key_points[:5]  # Limit to 5 key points
+        return key_points or fallback
 
 
 class SearchAgent(BaseAgent):
     """Agent specialized in web search and information gathering."""
     
+    __slots__ = ()
+    
     def __init__(self, agent_id: int):
-        super().__init__(
-            agent_id=agent_id,
-            name="SearchAgent",
-            role="Web search and information gathering specialist",
-            capabilities=["web_search", "information_gathering", "fact_checking", "research"]
-        )
+        super().__init__(agent_id=agent_id, **_SEARCH_META)
     
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute search task."""
         
+        # Not served from the result cache; web results go stale
         self.status = "active"
-        execution_context = AgentExecutionContext(
+        async with AgentExecutionContext.scoped(
             task_id=context.get("task_id", 0),
             user_input=task_input,
             session_context=context
-        )
-        
-        try:
-            # Extract search query from task input
-            search_query = self._extract_search_query(task_input)
-            
-            # Execute web search
-            search_result = await tool_executor.execute_single_tool(
-                agent_id=self.agent_id,
-                tool_name="web_search",
-                parameters={"query": search_query, "max_results": 5}
-            )
-            
-            execution_context.add_tool_result("web_search", search_result)
-            
-            # Process search results
-            processed_results = self._process_search_results(
-                search_result.get("result", {}).get("results", [])
-            )
-            
-            # Compile result
-            result = {
-                "success": search_result.get("success", False),
-                "agent_name": self.name,
-                "search_query": search_query,
-                "total_results": search_result.get("result", {}).get("total_results", 0),
-                "processed_results": processed_results,
-                "summary": self._create_search_summary(processed_results),
-                "sources": [r.get("url", "") for r in processed_results],
-                "tools_used": ["web_search"],
-                "confidence_level": "high" if search_result.get("success") and processed_results else "medium",
-                "execution_time": execution_context.get_execution_duration()
-            }
-            
-            self.status = "completed"
-            self.log_execution(task_input, result)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"SearchAgent execution error: {e}")
-            self.status = "failed"
-            
-            result = {
-                "success": False,
-                "agent_name": self.name,
-                "error": str(e),
-                "tools_used": [],
-                "confidence_level": "low"
-            }
-            
-            self.log_execution(task_input, result)
-            return result
-    
-    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        ) as execution_context:
+            try:
+                # Extract search query from task input
+                search_query = self._extract_search_query(task_input)
+                
+                # Execute web search
+                search_result = await tool_executor.execute_single_tool(
+                    agent_id=self.agent_id,
+                    tool_name="web_search",
+                    parameters={"query": search_query, "max_results": 5}
+                )
+                
+                execution_context.add_tool_result("web_search", search_result)
+                
+                # Process search results
+                search_data = search_result.get("result") or {}
+                processed_results = self._process_search_results(search_data.get("results", []))
+                
+                # Compile result
+                result = {
+                    "success": search_result.get("success", False),
+                    "agent_name": self.name,
+                    "search_query": search_query,
+                    "total_results": search_data.get("total_results", 0),
+                    "processed_results": processed_results,
+                    "summary": self._create_search_summary(processed_results),
+                    "sources": [r.get("url", "") for r in processed_results],
+                    "tools_used": ["web_search"],
+                    "confidence_level": "high" if search_result.get("success") and processed_results else "medium",
+                    "execution_time": execution_context.get_execution_duration()
+                }
+                
+                self.status = "completed"
+                self.log_execution(task_input, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"SearchAgent execution error: {e}")
+                self.status = "failed"
+                
+                result = _failure_result(self.name, e)
+                
+                self.log_execution(task_input, result)
+                return result
+    
+    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
         """Plan search actions."""
         
-        actions = [
-            {
-                "action": "extract_search_terms",
-                "description": "Extract relevant search terms from input",
-                "tool": "internal_processing",
-                "priority": "high"
-            },
-            {
-                "action": "web_search",
-                "description": "Search the web for relevant information",
-                "tool": "web_search",
-                "priority": "high"
-            },
-            {
-                "action": "process_results",
-                "description": "Process and organize search results",
-                "tool": "internal_processing",
-                "priority": "medium"
-            }
-        ]
-        
-        return actions
+        return _SEARCH_ACTIONS
     
     def _extract_search_query(self, task_input: str) -> str:
         """Extract search query from task input."""
         
-        # Remove common task prefixes
-        query = task_input.lower()
-        prefixes_to_remove = [
-            "search for", "find", "look up", "research", "tell me about",
-            "what is", "who is", "where is", "when is", "how to"
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if query.startswith(prefix):
-                query = query[len(prefix):].strip()
-                break
-        
-        # Clean up query
-        query = query.replace("?", "").replace("!", "").strip()
-        
-        return query if query else task_input
+        return _search_query(task_input)
     
     def _process_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and enhance search results."""
         
+        # Score first and sort indices, so each output dict is built once, already in order
+        scores = [self._calculate_relevance_score(result) for result in results]
+        order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        
         processed = []
         
-        for result in results:
-            processed_result = {
+        for i in order:
+            result = results[i]
+            url = result.get("url", "")
+            processed.append({
                 "title": result.get("title", ""),
-                "url": result.get("url", ""),
+                "url": url,
                 "snippet": result.get("snippet", ""),
-                "relevance_score": self._calculate_relevance_score(result),
-                "source_type": self._determine_source_type(result.get("url", ""))
-            }
-            processed.append(processed_result)
-        
-        # Sort by relevance score
-        processed.sort(key=lambda x: x["relevance_score"], reverse=True)
+                "relevance_score": scores[i],
+                "source_type": self._determine_source_type(url)
+            })
         
         return processed
     
@@ -280,20 +473,16 @@ class SearchAgent(BaseAgent):
         
         score = 0.5  # Base score
         
-        title = result.get("title", "").lower()
-        snippet = result.get("snippet", "").lower()
-        
         # Boost score for authoritative sources
-        url = result.get("url", "").lower()
-        if any(domain in url for domain in ["wikipedia.org", "gov", "edu", "stackoverflow.com"]):
+        if _AUTH_RE.search(result.get("url", "")):
             score += 0.3
         
         # Boost score for recent content indicators
-        if any(term in snippet for term in ["2024", "2023", "recent", "latest", "new"]):
+        if _RECENT_RE.search(result.get("snippet", "")):
             score += 0.1
         
         # Boost score for comprehensive content indicators
-        if any(term in title for term in ["guide", "tutorial", "complete", "comprehensive"]):
+        if _COMPREH_RE.search(result.get("title", "")):
             score += 0.1
         
         return min(score, 1.0)
@@ -301,20 +490,7 @@ class SearchAgent(BaseAgent):
     def _determine_source_type(self, url: str) -> str:
         """Determine the type of source based on URL."""
         
-        url_lower = url.lower()
-        
-        if "wikipedia.org" in url_lower:
-            return "encyclopedia"
-        elif any(domain in url_lower for domain in [".gov", ".edu"]):
-            return "official"
-        elif "stackoverflow.com" in url_lower:
-            return "technical"
-        elif any(domain in url_lower for domain in ["news", "reuters", "bbc", "cnn"]):
-            return "news"
-        elif "blog" in url_lower:
-            return "blog"
-        else:
-            return "general"
+        return _source_type(url)
     
     def _create_search_summary(self, results: List[Dict[str, Any]]) -> str:
         """Create summary of search results."""
@@ -322,115 +498,84 @@ class SearchAgent(BaseAgent):
         if not results:
             return "No relevant information found."
         
-        summary_parts = []
-        
-        # Add overview
-        summary_parts.append(f"Found {len(results)} relevant sources:")
-        
-        # Add top results
-        for i, result in enumerate(results[:3], 1):
-            title = result["title"][:80] + "..." if len(result["title"]) > 80 else result["title"]
-            source_type = result["source_type"]
-            summary_parts.append(f"{i}. {title} ({source_type} source)")
+        # Overview followed by the top results
+        lines = [f"Found {len(results)} relevant sources:"]
+        lines.extend(
+            f"{i}. {_trunc(result['title'])} ({result['source_type']} source)"
+            for i, result in enumerate(results[:3], 1)
+        )
         
-        return "\n".join(summary_parts)
+        return "\n".join(lines)
 
 
 class CodingAgent(BaseAgent):
     """Agent specialized in code generation, review, and debugging."""
     
+    __slots__ = ()
+    
     def __init__(self, agent_id: int):
-        super().__init__(
-            agent_id=agent_id,
-            name="CodingAgent",
-            role="Code generation, review, and debugging specialist",
-            capabilities=["code_generation", "code_review", "debugging", "syntax_checking", "documentation"]
-        )
+        super().__init__(agent_id=agent_id, **_CODING_META)
     
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute coding task."""
         
+        cached = self.get_cached_result(task_input)
+        if cached is not None:
+            self.status = "completed"
+            self.log_execution(task_input, cached)
+            return cached
+        
         self.status = "active"
-        execution_context = AgentExecutionContext(
+        async with AgentExecutionContext.scoped(
             task_id=context.get("task_id", 0),
             user_input=task_input,
             session_context=context
-        )
-        
-        try:
-            # Determine coding task type
-            task_type = self._determine_task_type(task_input)
-            
-            # Execute based on task type
-            if task_type == "generation":
-                result = await self._handle_code_generation(task_input, execution_context)
-            elif task_type == "review":
-                result = await self._handle_code_review(task_input, execution_context)
-            elif task_type == "debugging":
-                result = await self._handle_debugging(task_input, execution_context)
-            else:
-                result = await self._handle_general_coding(task_input, execution_context)
-            
-            self.status = "completed"
-            self.log_execution(task_input, result)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"CodingAgent execution error: {e}")
-            self.status = "failed"
-            
-            result = {
-                "success": False,
-                "agent_name": self.name,
-                "error": str(e),
-                "tools_used": [],
-                "confidence_level": "low"
-            }
-            
-            self.log_execution(task_input, result)
-            return result
-    
-    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        ) as execution_context:
+            try:
+                # Determine coding task type
+                task_type = self._determine_task_type(task_input)
+                
+                # Execute based on task type
+                if task_type == "generation":
+                    result = await self._handle_code_generation(task_input, execution_context)
+                elif task_type == "review":
+                    result = await self._handle_code_review(task_input, execution_context)
+                elif task_type == "debugging":
+                    result = await self._handle_debugging(task_input, execution_context)
+                else:
+                    result = await self._handle_general_coding(task_input, execution_context)
+                
+                self.status = "completed"
+                self.log_execution(task_input, result)
+                self.cache_result(task_input, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"CodingAgent execution error: {e}")
+                self.status = "failed"
+                
+                result = _failure_result(self.name, e)
+                
+                self.log_execution(task_input, result)
+                return result
+    
+    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
         """Plan coding actions."""
         
         task_type = self._determine_task_type(task_input)
         
         if task_type == "generation":
-            actions = [
-                {"action": "analyze_requirements", "tool": "internal_processing", "priority": "high"},
-                {"action": "design_solution", "tool": "internal_processing", "priority": "high"},
-                {"action": "generate_code", "tool": "internal_processing", "priority": "high"},
-                {"action": "validate_syntax", "tool": "internal_processing", "priority": "medium"}
-            ]
+            return _CODING_GEN_ACTIONS
         elif task_type == "review":
-            actions = [
-                {"action": "read_code", "tool": "file_reader", "priority": "high"},
-                {"action": "analyze_code", "tool": "internal_processing", "priority": "high"},
-                {"action": "check_best_practices", "tool": "internal_processing", "priority": "medium"}
-            ]
+            return _CODING_REVIEW_ACTIONS
         else:
-            actions = [
-                {"action": "understand_problem", "tool": "internal_processing", "priority": "high"},
-                {"action": "research_solution", "tool": "web_search", "priority": "medium"},
-                {"action": "provide_solution", "tool": "internal_processing", "priority": "high"}
-            ]
-        
-        return actions
+            return _CODING_DEFAULT_ACTIONS
     
     def _determine_task_type(self, task_input: str) -> str:
         """Determine the type of coding task."""
         
-        task_lower = task_input.lower()
-        
-        if any(term in task_lower for term in ["generate", "create", "write", "build", "implement"]):
-            return "generation"
-        elif any(term in task_lower for term in ["review", "check", "analyze", "audit"]):
-            return "review"
-        elif any(term in task_lower for term in ["debug", "fix", "error", "bug", "issue"]):
-            return "debugging"
-        else:
-            return "general"
+        return _task_type(task_input)
     
     async def _handle_code_generation(self, task_input: str, context: AgentExecutionContext) -> Dict[str, Any]:
         """Handle code generation tasks."""
@@ -521,28 +666,22 @@ class CodingAgent(BaseAgent):
     def _extract_programming_language(self, task_input: str) -> str:
         """Extract programming language from task input."""
         
-        languages = ["python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby"]
-        task_lower = task_input.lower()
-        
-        for lang in languages:
-            if lang in task_lower:
-                return lang
-        
-        return "python"  # Default
+        return _programming_language(task_input)
     
     def _extract_requirements(self, task_input: str) -> List[str]:
         """Extract requirements from task input."""
         
         # Simple requirement extraction
         requirements = []
+        task_lower = task_input.lower()
         
-        if "function" in task_input.lower():
+        if "function" in task_lower:
             requirements.append("Create a function")
-        if "class" in task_input.lower():
+        if "class" in task_lower:
             requirements.append("Create a class")
-        if "api" in task_input.lower():
+        if "api" in task_lower:
             requirements.append("API integration")
-        if "database" in task_input.lower():
+        if "database" in task_lower:
             requirements.append("Database operations")
         
         return requirements if requirements else ["General implementation"]
@@ -550,36 +689,8 @@ class CodingAgent(BaseAgent):
     def _generate_code_template(self, language: str, requirements: List[str]) -> str:
         """Generate basic code template."""
         
-        if language == "python":
-            return '''def example_function():
-    """
-    Example function implementation.
-    Modify according to your specific requirements.
-    """
-    # TODO: Implement your logic here
-    pass
-
-# Example usage
-if __name__ == "__main__":
-    result = example_function()
-    print(result)'''
-        
-        elif language == "javascript":
-            return '''function exampleFunction() {
-    /**
-     * Example function implementation.
-     * Modify according to your specific requirements.
-     */
-    // TODO: Implement your logic here
-    return null;
-}
-
-// Example usage
-const result = exampleFunction();
-console.log(result);'''
-        
-        else:
-            return f"// {language} code template\n// TODO: Implement your solution here"
+        template = _GENERATED_CODE_TEMPLATES.get(language)
+        return template if template is not None else _default_template(language)
     
     def _explain_code(self, code: str) -> str:
         """Provide explanation for generated code."""
@@ -596,13 +707,12 @@ Modify the function name, parameters, and implementation according to your speci
         """Extract code snippet from input."""
         
         # Look for code blocks
-        import re
-        code_blocks = re.findall(r'```[\w]*\n(.*?)\n```', task_input, re.DOTALL)
+        code_blocks = _CODE_BLOCK.findall(task_input)
         if code_blocks:
             return code_blocks[0]
         
         # Look for inline code
-        inline_code = re.findall(r'`([^`]+)`', task_input)
+        inline_code = _INLINE_CODE.findall(task_input)
         if inline_code:
             return inline_code[0]
         
@@ -654,111 +764,71 @@ Modify the function name, parameters, and implementation according to your speci
 class SchedulerAgent(BaseAgent):
     """Agent specialized in task scheduling and time management."""
     
+    __slots__ = ()
+    
     def __init__(self, agent_id: int):
-        super().__init__(
-            agent_id=agent_id,
-            name="SchedulerAgent",
-            role="Task scheduling and time management specialist",
-            capabilities=["scheduling", "time_management", "calendar_operations", "deadline_tracking"]
-        )
+        super().__init__(agent_id=agent_id, **_SCHEDULER_META)
     
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute scheduling task."""
         
         self.status = "active"
-        execution_context = AgentExecutionContext(
+        async with AgentExecutionContext.scoped(
             task_id=context.get("task_id", 0),
             user_input=task_input,
             session_context=context
-        )
-        
-        try:
-            # Get current date/time
-            datetime_result = await tool_executor.execute_single_tool(
-                agent_id=self.agent_id,
-                tool_name="datetime_tool",
-                parameters={"operation": "now"}
-            )
-            
-            execution_context.add_tool_result("datetime_tool", datetime_result)
-            
-            # Parse scheduling request
-            schedule_info = self._parse_schedule_request(task_input)
-            
-            # Create schedule
-            schedule = self._create_schedule(schedule_info, datetime_result.get("result", {}))
-            
-            # Compile result
-            result = {
-                "success": True,
-                "agent_name": self.name,
-                "schedule_info": schedule_info,
-                "created_schedule": schedule,
-                "current_time": datetime_result.get("result", {}).get("current_datetime", ""),
-                "tools_used": ["datetime_tool"],
-                "confidence_level": "high",
-                "execution_time": execution_context.get_execution_duration()
-            }
-            
-            self.status = "completed"
-            self.log_execution(task_input, result)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"SchedulerAgent execution error: {e}")
-            self.status = "failed"
-            
-            result = {
-                "success": False,
-                "agent_name": self.name,
-                "error": str(e),
-                "tools_used": [],
-                "confidence_level": "low"
-            }
-            
-            self.log_execution(task_input, result)
-            return result
-    
-    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        ) as execution_context:
+            try:
+                # Get current date/time
+                datetime_result = await tool_executor.execute_single_tool(
+                    agent_id=self.agent_id,
+                    tool_name="datetime_tool",
+                    parameters={"operation": "now"}
+                )
+                
+                execution_context.add_tool_result("datetime_tool", datetime_result)
+                
+                # Parse scheduling request
+                schedule_info = self._parse_schedule_request(task_input)
+                
+                # Create schedule
+                current_time_info = datetime_result.get("result") or {}
+                schedule = self._create_schedule(schedule_info, current_time_info)
+                
+                # Compile result
+                result = {
+                    "success": True,
+                    "agent_name": self.name,
+                    "schedule_info": schedule_info,
+                    "created_schedule": schedule,
+                    "current_time": current_time_info.get("current_datetime", ""),
+                    "tools_used": ["datetime_tool"],
+                    "confidence_level": "high",
+                    "execution_time": execution_context.get_execution_duration()
+                }
+                
+                self.status = "completed"
+                self.log_execution(task_input, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"SchedulerAgent execution error: {e}")
+                self.status = "failed"
+                
+                result = _failure_result(self.name, e)
+                
+                self.log_execution(task_input, result)
+                return result
+    
+    async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
         """Plan scheduling actions."""
         
-        actions = [
-            {
-                "action": "get_current_time",
-                "description": "Get current date and time",
-                "tool": "datetime_tool",
-                "priority": "high"
-            },
-            {
-                "action": "parse_schedule_request",
-                "description": "Parse scheduling requirements",
-                "tool": "internal_processing",
-                "priority": "high"
-            },
-            {
-                "action": "create_schedule",
-                "description": "Create optimized schedule",
-                "tool": "internal_processing",
-                "priority": "medium"
-            }
-        ]
-        
-        return actions
+        return _SCHEDULER_ACTIONS
     
     def _parse_schedule_request(self, task_input: str) -> Dict[str, Any]:
         """Parse scheduling request from input."""
         
-        import re
-        
-        # Extract time-related information
-        time_patterns = {
-            "duration": r'(\d+)\s*(hour|minute|day|week)s?',
-            "deadline": r'(by|before|until)\s+(\w+)',
-            "start_time": r'(at|from)\s+(\d{1,2}:\d{2}|\d{1,2}\s*(am|pm))',
-            "date": r'(\d{1,2}/\d{1,2}|\w+day|\w+\s+\d{1,2})'
-        }
-        
         parsed_info = {
             "task_description": task_input,
             "duration": None,
@@ -770,20 +840,26 @@ class SchedulerAgent(BaseAgent):
         
         task_lower = task_input.lower()
         
-        # Extract duration
-        duration_match = re.search(time_patterns["duration"], task_lower)
-        if duration_match:
-            parsed_info["duration"] = f"{duration_match.group(1)} {duration_match.group(2)}s"
-        
-        # Extract deadline
-        deadline_match = re.search(time_patterns["deadline"], task_lower)
-        if deadline_match:
-            parsed_info["deadline"] = deadline_match.group(2)
+        urgent = later = False
+        
+        # Extract duration, deadline and priority cues; the first occurrence of each wins
+        for match in _SCHEDULE_RE.finditer(task_lower):
+            kind = match.lastgroup
+            if kind == "duration":
+                if parsed_info["duration"] is None:
+                    parsed_info["duration"] = f"{match.group('amount')} {match.group('unit')}s"
+            elif kind == "deadline":
+                if parsed_info["deadline"] is None:
+                    parsed_info["deadline"] = match.group("due")
+            elif kind == "urgent":
+                urgent = True
+            else:
+                later = True
         
         # Determine priority
-        if any(word in task_lower for word in ["urgent", "asap", "immediately"]):
+        if urgent:
             parsed_info["priority"] = "high"
-        elif any(word in task_lower for word in ["later", "eventually", "when possible"]):
+        elif later:
             parsed_info["priority"] = "low"
         
         return parsed_info
@@ -791,8 +867,6 @@ class SchedulerAgent(BaseAgent):
     def _create_schedule(self, schedule_info: Dict[str, Any], current_time_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create schedule based on parsed information."""
         
-        from datetime import datetime, timedelta
-        
         current_time = current_time_info.get("current_datetime", "")
         
         schedule = {
@@ -1,18 +1,179 @@
 """Dynamic agent implementation for EUNA MVP."""
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Any, Optional, Callable
 
 from agents.base_agent import BaseAgent, AgentExecutionContext
+from config.settings import get_settings
 from services.groq_service import groq_service
 from tools.tool_executor import tool_executor
 
 logger = logging.getLogger(__name__)
 
+# Patterns for deriving default tool parameters from task input
+_MATH_RE = re.compile(r'[\d+\-*/().%\s]+')
+_URL_RE = re.compile(r'https?://(?:[a-zA-Z0-9$-_@.&+!*(),]|%[0-9a-fA-F]{2})+')
+
+# Identical failing tool calls allowed before the rest of the chain is aborted
+_MAX_REPEATED_FAILURES = 2
+
+# Weight of each confidence level in the average reported by get_performance_metrics
+_CONFIDENCE_WEIGHTS = {"high": 1, "medium": 0.5}
+
+# Confidence level to index into _score's bonus table; anything else scores as "low"
+_CONFIDENCE_INDEX = {"high": 0, "medium": 1, "low": 2}
+
+
+def _score(n_successful: int, n_total: int, confidence_idx: int, reasoning_len: int, n_actions: int) -> float:
+    """Numeric validation score for a DynamicAgent execution."""
+    
+    score = 0.0
+    if n_total > 0:
+        score += (n_successful / n_total) * 0.4
+    else:
+        score += 0.2  # Some credit for reasoning
+    score += (0.3, 0.2, 0.1)[confidence_idx]
+    if reasoning_len > 50:
+        score += 0.2
+    if n_actions > 0:
+        score += 0.1
+    return score
+
+
+# Default parameter builders, keyed by tool name
+def _web_search_params(task_input: str) -> Dict[str, Any]:
+    """Build web_search parameters from task input."""
+    
+    # Extract search terms from task input
+    search_query = task_input
+    if len(search_query) > 100:
+        # Use first sentence as query
+        search_query = search_query.split('.')[0]
+    
+    return {
+        "query": search_query,
+        "max_results": 5
+    }
+
+
+def _calculator_params(task_input: str) -> Dict[str, Any]:
+    """Build calculator parameters from task input."""
+    
+    # Look for mathematical expressions
+    math_expressions = _MATH_RE.findall(task_input)
+    expression = math_expressions[0].strip() if math_expressions else "1+1"
+    
+    return {"expression": expression}
+
+
+def _json_parser_params(task_input: str) -> Dict[str, Any]:
+    """Build json_parser parameters from task input."""
+    
+    # Look for JSON content, from the first "{" to the last "}"
+    _, brace, rest = task_input.partition("{")
+    if brace:
+        inner, closing_brace, _ = rest.rpartition("}")
+        if closing_brace:
+            return {"json_data": "{" + inner + "}"}
+    
+    return {"json_data": "{}"}
+
+
+def _http_request_params(task_input: str) -> Dict[str, Any]:
+    """Build http_request parameters from task input."""
+    
+    # Look for URLs
+    url_match = _URL_RE.search(task_input)
+    url = url_match.group() if url_match else "https://httpbin.org/get"
+    
+    return {
+        "url": url,
+        "method": "GET"
+    }
+
+
+_PARAM_BUILDERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "web_search": _web_search_params,
+    "calculator": _calculator_params,
+    "text_summarizer": lambda task_input: {"text": task_input, "max_sentences": 3},
+    "datetime_tool": lambda task_input: {"operation": "now"},
+    "json_parser": _json_parser_params,
+    "http_request": _http_request_params
+}
+
+# One-line summaries of successful tool results, keyed by tool name
+_SUMMARIZERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "web_search": lambda result: f"Found {result.get('total_results', 0)} relevant search results",
+    "calculator": lambda result: f"Calculated result: {result.get('result')}",
+    "text_summarizer": lambda result: f"Created summary ({result.get('summary_length', 0)} characters)",
+    "datetime_tool": lambda result: f"Retrieved current time: {result.get('current_datetime', '')}",
+    "json_parser": lambda result: f"Parsed JSON data (type: {result.get('data_type', 'unknown')})",
+    "http_request": lambda result: f"HTTP request completed (status: {result.get('status_code', 0)})"
+}
+
+
+class _ToolCallGuard:
+    """Per-execution loop detector for a chain of tool calls."""
+    
+    __slots__ = ("max_calls", "calls", "failures", "abort_reason", "_locks")
+    
+    def __init__(self, max_calls: int):
+        self.max_calls = max_calls
+        self.calls = 0
+        self.failures: Counter = Counter()  # signature -> consecutive failures
+        self.abort_reason: Optional[str] = None
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+    
+    @staticmethod
+    def signature(tool_name: str, parameters: Dict[str, Any]) -> tuple:
+        """Identify a call by tool name and parameter digest."""
+        digest = hashlib.md5(json.dumps(parameters, sort_keys=True, default=str).encode()).digest()
+        return tool_name, digest
+    
+    def lock(self, signature: tuple) -> asyncio.Lock:
+        """Lock that runs identical calls one at a time, so each sees the previous outcome."""
+        lock = self._locks.get(signature)
+        if lock is None:
+            lock = self._locks[signature] = asyncio.Lock()
+        return lock
+    
+    def admit(self, signature: tuple) -> bool:
+        """Check whether another call may run, recording why not if it may not."""
+        if self.failures[signature] >= _MAX_REPEATED_FAILURES:
+            self.abort_reason = f"Aborted repeated failing call to {signature[0]}"
+            return False
+        if self.calls >= self.max_calls:
+            self.abort_reason = f"Aborted tool chain after {self.max_calls} calls"
+            return False
+        self.calls += 1
+        return True
+    
+    def record(self, signature: tuple, result: Dict[str, Any]):
+        """Count a failed call against its signature; a success resets the count."""
+        if result.get("success", False):
+            self.failures.pop(signature, None)
+        else:
+            self.failures[signature] += 1
+
 
 class DynamicAgent(BaseAgent):
     """Dynamically generated agent based on GROQ-created specifications."""
     
+    __slots__ = (
+        "system_prompt", "specialization", "preferred_tools",
+        "success_criteria", "validation_steps", "agent_definition", "_reasoning_cache"
+    )
+    
+    # Bounds of the reasoning results shared between plan_actions and execute
+    REASONING_CACHE_SIZE = 128
+    REASONING_CACHE_TTL = 300.0
+    
     def __init__(self, agent_id: int, agent_definition: Dict[str, Any]):
         super().__init__(
             agent_id=agent_id,
@@ -27,100 +188,107 @@ class DynamicAgent(BaseAgent):
         self.success_criteria = agent_definition.get("success_criteria", [])
         self.validation_steps = agent_definition.get("validation_steps", [])
         self.agent_definition = agent_definition
+        self._reasoning_cache: OrderedDict = OrderedDict()  # key -> (expires_at, future)
     
     async def execute(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute dynamic agent task using GROQ reasoning."""
         
         self.status = "active"
-        execution_context = AgentExecutionContext(
+        async with AgentExecutionContext.scoped(
             task_id=context.get("task_id", 0),
             user_input=task_input,
             session_context=context
-        )
-        
-        try:
-            # Use GROQ for agent reasoning
-            reasoning_result = await groq_service.execute_agent_reasoning(
-                agent_prompt=self.system_prompt,
-                task_input=task_input,
-                context=context,
-                tools_available=self.preferred_tools
-            )
-            
-            # Execute planned tools
-            tool_results = []
-            tools_needed = reasoning_result.get("tools_needed", [])
-            
-            for tool_name in tools_needed:
-                if tool_name in self.preferred_tools:
-                    # Determine tool parameters based on reasoning
-                    tool_params = await self._determine_tool_parameters(
-                        tool_name, task_input, context, reasoning_result
-                    )
-                    
-                    # Execute tool
-                    tool_result = await tool_executor.execute_single_tool(
-                        agent_id=self.agent_id,
-                        tool_name=tool_name,
-                        parameters=tool_params
-                    )
-                    
+        ) as execution_context:
+            try:
+                # Use GROQ for agent reasoning
+                reasoning_result = await self._reason(task_input, context)
+                
+                # Execute planned tools; they only depend on the reasoning, so run them concurrently
+                tool_names = [
+                    tool_name for tool_name in reasoning_result.get("tools_needed", [])
+                    if tool_name in self.preferred_tools
+                ]
+                settings = get_settings()
+                semaphore = asyncio.Semaphore(settings.max_parallel_tools)
+                guard = _ToolCallGuard(settings.max_tool_calls_per_task)
+                outcomes = await asyncio.gather(
+                    *(self._run_one_tool(tool_name, task_input, context, reasoning_result, semaphore, guard)
+                      for tool_name in tool_names),
+                    return_exceptions=True
+                )
+                
+                tool_results = []
+                for tool_name, tool_result in zip(tool_names, outcomes):
+                    if tool_result is None:
+                        continue  # Skipped by the loop guard
+                    if isinstance(tool_result, Exception):
+                        tool_result = {
+                            "success": False,
+                            "tool_name": tool_name,
+                            "result": None,
+                            "error": str(tool_result)
+                        }
                     tool_results.append(tool_result)
                     execution_context.add_tool_result(tool_name, tool_result)
-            
-            # Validate results against success criteria
-            validation_result = await self._validate_results(
-                reasoning_result, tool_results, task_input
-            )
-            
-            # Compile final result
-            result = {
-                "success": validation_result["success"],
-                "agent_name": self.name,
-                "agent_type": "dynamic",
-                "specialization": self.specialization,
-                "reasoning": reasoning_result.get("reasoning", ""),
-                "planned_actions": reasoning_result.get("planned_actions", []),
-                "tools_used": [r["tool_name"] for r in tool_results if r["success"]],
-                "tool_results": tool_results,
-                "validation": validation_result,
-                "confidence_level": reasoning_result.get("confidence_level", "medium"),
-                "output": self._synthesize_output(reasoning_result, tool_results, validation_result),
-                "next_steps": reasoning_result.get("next_steps", []),
-                "execution_time": execution_context.get_execution_duration()
-            }
-            
-            self.status = "completed"
-            self.log_execution(task_input, result)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"DynamicAgent {self.name} execution error: {e}")
-            self.status = "failed"
-            
-            result = {
-                "success": False,
-                "agent_name": self.name,
-                "agent_type": "dynamic",
-                "error": str(e),
-                "tools_used": [],
-                "confidence_level": "low"
-            }
-            
-            self.log_execution(task_input, result)
-            return result
+                
+                successful_tools = [r for r in tool_results if r.get("success", False)] if tool_results else []
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "%s ran %d/%d tools (%d succeeded): %s",
+                        self.name, len(tool_results), len(tool_names), len(successful_tools),
+                        [r.get("tool_name") for r in tool_results]
+                    )
+                
+                # Validate results against success criteria
+                validation_result = await self._validate_results(
+                    reasoning_result, tool_results, task_input, successful_tools
+                )
+                if guard.abort_reason:
+                    validation_result["validation_notes"].append(guard.abort_reason)
+                
+                # Compile final result
+                result = {
+                    "success": validation_result["success"],
+                    "agent_name": self.name,
+                    "agent_type": "dynamic",
+                    "specialization": self.specialization,
+                    "reasoning": reasoning_result.get("reasoning", ""),
+                    "planned_actions": reasoning_result.get("planned_actions", []),
+                    "tools_used": [r["tool_name"] for r in successful_tools],
+                    "tool_results": tool_results,
+                    "validation": validation_result,
+                    "confidence_level": reasoning_result.get("confidence_level", "medium"),
+                    "output": self._synthesize_output(reasoning_result, successful_tools, validation_result),
+                    "next_steps": reasoning_result.get("next_steps", []),
+                    "execution_time": execution_context.get_execution_duration()
+                }
+                
+                self.status = "completed"
+                self.log_execution(task_input, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error("DynamicAgent %s execution error: %s", self.name, e)
+                self.status = "failed"
+                
+                result = {
+                    "success": False,
+                    "agent_name": self.name,
+                    "agent_type": "dynamic",
+                    "error": str(e),
+                    "tools_used": [],
+                    "confidence_level": "low"
+                }
+                
+                self.log_execution(task_input, result)
+                return result
     
     async def plan_actions(self, task_input: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Plan actions using GROQ reasoning."""
         
         try:
-            reasoning_result = await groq_service.execute_agent_reasoning(
-                agent_prompt=self.system_prompt,
-                task_input=task_input,
-                context=context,
-                tools_available=self.preferred_tools
-            )
+            reasoning_result = await self._reason(task_input, context)
             
             planned_actions = reasoning_result.get("planned_actions", [])
             tools_needed = reasoning_result.get("tools_needed", [])
@@ -139,7 +307,7 @@ class DynamicAgent(BaseAgent):
             return actions
             
         except Exception as e:
-            logger.error(f"Error planning actions for {self.name}: {e}")
+            logger.error("Error planning actions for %s: %s", self.name, e)
             return [
                 {
                     "action": "fallback_processing",
@@ -149,6 +317,73 @@ class DynamicAgent(BaseAgent):
                 }
             ]
     
+    async def _reason(self, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run GROQ reasoning for task_input, sharing one call between plan_actions and execute."""
+        
+        key = hashlib.blake2b(
+            (
+                self.system_prompt + task_input + json.dumps(self.preferred_tools, sort_keys=True)
+                + json.dumps(context, sort_keys=True, default=str)
+            ).encode(),
+            digest_size=16
+        ).digest()
+        cache = self._reasoning_cache
+        now = time.monotonic()
+        
+        entry = cache.get(key)
+        if entry is None or entry[0] <= now:
+            future = asyncio.ensure_future(groq_service.execute_agent_reasoning(
+                agent_prompt=self.system_prompt,
+                task_input=task_input,
+                context=context,
+                tools_available=self.preferred_tools
+            ))
+            entry = (now + self.REASONING_CACHE_TTL, future)
+            cache[key] = entry
+            if len(cache) > self.REASONING_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            future = entry[1]
+        cache.move_to_end(key)
+        
+        try:
+            # Shielded so one cancelled caller does not cancel the call for the others
+            result = await asyncio.shield(future)
+        except Exception:
+            if cache.get(key) is entry:
+                del cache[key]
+            raise
+        
+        # Error fallbacks are returned rather than raised; retry them on the next call
+        if result.get("fallback") and cache.get(key) is entry:
+            del cache[key]
+        return result
+    
+    async def _run_one_tool(self, tool_name: str, task_input: str, context: Dict[str, Any],
+                            reasoning: Dict[str, Any], semaphore: asyncio.Semaphore,
+                            guard: _ToolCallGuard) -> Optional[Dict[str, Any]]:
+        """Determine parameters for a tool and execute it; None if the loop guard skips it."""
+        
+        async with semaphore:
+            # Determine tool parameters based on reasoning
+            tool_params = await self._determine_tool_parameters(
+                tool_name, task_input, context, reasoning
+            )
+            
+            signature = guard.signature(tool_name, tool_params)
+            async with guard.lock(signature):
+                if not guard.admit(signature):
+                    logger.warning("%s: %s", self.name, guard.abort_reason)
+                    return None
+                
+                tool_result = await tool_executor.execute_single_tool(
+                    agent_id=self.agent_id,
+                    tool_name=tool_name,
+                    parameters=tool_params
+                )
+                guard.record(signature, tool_result)
+                return tool_result
+    
     async def _determine_tool_parameters(self, tool_name: str, task_input: str, 
                                        context: Dict[str, Any], reasoning: Dict[str, Any]) -> Dict[str, Any]:
         """Determine tool parameters based on agent reasoning."""
@@ -168,70 +403,21 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
             return await self._get_default_tool_parameters(tool_name, task_input, context)
             
         except Exception as e:
-            logger.warning(f"Error determining parameters for {tool_name}: {e}")
+            logger.warning("Error determining parameters for %s: %s", tool_name, e)
             return await self._get_default_tool_parameters(tool_name, task_input, context)
     
     async def _get_default_tool_parameters(self, tool_name: str, task_input: str, 
                                          context: Dict[str, Any]) -> Dict[str, Any]:
         """Get default parameters for tools."""
         
-        if tool_name == "web_search":
-            # Extract search terms from task input
-            search_query = task_input
-            if len(search_query) > 100:
-                # Use first sentence as query
-                search_query = search_query.split('.')[0]
-            
-            return {
-                "query": search_query,
-                "max_results": 5
-            }
-        
-        elif tool_name == "calculator":
-            # Look for mathematical expressions
-            import re
-            math_expressions = re.findall(r'[\d+\-*/().%\s]+', task_input)
-            expression = math_expressions[0].strip() if math_expressions else "1+1"
-            
-            return {"expression": expression}
-        
-        elif tool_name == "text_summarizer":
-            return {
-                "text": task_input,
-                "max_sentences": 3
-            }
-        
-        elif tool_name == "datetime_tool":
-            return {"operation": "now"}
-        
-        elif tool_name == "json_parser":
-            # Look for JSON content
-            if "{" in task_input and "}" in task_input:
-                start = task_input.find("{")
-                end = task_input.rfind("}") + 1
-                json_content = task_input[start:end]
-                return {"json_data": json_content}
-            else:
-                return {"json_data": "{}"}
-        
-        elif tool_name == "http_request":
-            # Look for URLs
-            import re
-            urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', task_input)
-            url = urls[0] if urls else "https://httpbin.org/get"
-            
-            return {
-                "url": url,
-                "method": "GET"
-            }
-        
-        else:
-            return {"input": task_input}
+        builder = _PARAM_BUILDERS.get(tool_name)
+        return builder(task_input) if builder else {"input": task_input}
     
     async def _validate_results(self, reasoning_result: Dict[str, Any], 
                               tool_results: List[Dict[str, Any]], 
-                              original_task: str) -> Dict[str, Any]:
-        """Validate results against success criteria."""
+                              original_task: str,
+                              successful_tools: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Validate results against success criteria; successful_tools may be passed pre-filtered."""
         
         validation = {
             "success": True,
@@ -241,33 +427,32 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
             "validation_notes": []
         }
         
-        # Check if tools executed successfully
-        successful_tools = [r for r in tool_results if r.get("success", False)]
-        total_tools = len(tool_results)
-        
-        if total_tools > 0:
-            tool_success_rate = len(successful_tools) / total_tools
-            validation["overall_score"] += tool_success_rate * 0.4
+        # Reasoning-only executions skip the tool bookkeeping entirely
+        if not tool_results:
+            n_successful = n_total = 0
         else:
-            validation["overall_score"] += 0.2  # Some credit for reasoning
+            if successful_tools is None:
+                successful_tools = [r for r in tool_results if r.get("success", False)]
+            n_successful, n_total = len(successful_tools), len(tool_results)
         
-        # Check confidence level
         confidence = reasoning_result.get("confidence_level", "medium")
-        confidence_scores = {"high": 0.3, "medium": 0.2, "low": 0.1}
-        validation["overall_score"] += confidence_scores.get(confidence, 0.1)
+        reasoning_len = len(reasoning_result.get("reasoning", ""))
+        n_actions = len(reasoning_result.get("planned_actions", []))
+        
+        # Tool success rate, confidence, reasoning depth and planning
+        validation["overall_score"] = _score(
+            n_successful, n_total,
+            _CONFIDENCE_INDEX.get(confidence, 2), reasoning_len, n_actions
+        )
         
         # Check if reasoning is comprehensive
-        reasoning_text = reasoning_result.get("reasoning", "")
-        if len(reasoning_text) > 50:
-            validation["overall_score"] += 0.2
+        if reasoning_len > 50:
             validation["criteria_met"].append("Comprehensive reasoning provided")
         else:
             validation["criteria_failed"].append("Reasoning too brief")
         
         # Check if actions were planned
-        planned_actions = reasoning_result.get("planned_actions", [])
-        if len(planned_actions) > 0:
-            validation["overall_score"] += 0.1
+        if n_actions > 0:
             validation["criteria_met"].append("Actions planned")
         else:
             validation["criteria_failed"].append("No actions planned")
@@ -284,7 +469,7 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
         return validation
     
     def _synthesize_output(self, reasoning_result: Dict[str, Any], 
-                          tool_results: List[Dict[str, Any]], 
+                          successful_tools: List[Dict[str, Any]], 
                           validation_result: Dict[str, Any]) -> str:
         """Synthesize comprehensive output from all results."""
         
@@ -299,13 +484,12 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
             output_parts.append(f"**Analysis:** {reasoning}")
         
         # Add tool results summary
-        successful_tools = [r for r in tool_results if r.get("success", False)]
         if successful_tools:
             output_parts.append("**Actions Taken:**")
-            for tool_result in successful_tools:
-                tool_name = tool_result["tool_name"]
-                summary = self._summarize_tool_result(tool_result)
-                output_parts.append(f"• {tool_name}: {summary}")
+            output_parts.extend(
+                f"• {tool_result['tool_name']}: {self._summarize_tool_result(tool_result)}"
+                for tool_result in successful_tools
+            )
         
         # Add validation summary
         if validation_result["success"]:
@@ -317,8 +501,7 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
         next_steps = reasoning_result.get("next_steps", [])
         if next_steps:
             output_parts.append("**Recommended Next Steps:**")
-            for step in next_steps:
-                output_parts.append(f"• {step}")
+            output_parts.extend(f"• {step}" for step in next_steps)
         
         return "\n\n".join(output_parts)
     
@@ -328,35 +511,8 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
         if not tool_result.get("success", False):
             return f"Failed - {tool_result.get('error', 'Unknown error')}"
         
-        result = tool_result.get("result", {})
-        tool_name = tool_result["tool_name"]
-        
-        if tool_name == "web_search":
-            total_results = result.get("total_results", 0)
-            return f"Found {total_results} relevant search results"
-        
-        elif tool_name == "calculator":
-            calc_result = result.get("result")
-            return f"Calculated result: {calc_result}"
-        
-        elif tool_name == "text_summarizer":
-            summary_length = result.get("summary_length", 0)
-            return f"Created summary ({summary_length} characters)"
-        
-        elif tool_name == "datetime_tool":
-            current_time = result.get("current_datetime", "")
-            return f"Retrieved current time: {current_time[:19]}"
-        
-        elif tool_name == "json_parser":
-            data_type = result.get("data_type", "unknown")
-            return f"Parsed JSON data (type: {data_type})"
-        
-        elif tool_name == "http_request":
-            status_code = result.get("status_code", 0)
-            return f"HTTP request completed (status: {status_code})"
-        
-        else:
-            return "Executed successfully"
+        summarizer = _SUMMARIZERS.get(tool_result["tool_name"])
+        return summarizer(tool_result.get("result", {})) if summarizer else "Executed successfully"
     
     def get_agent_definition(self) -> Dict[str, Any]:
         """Get the original agent definition."""
@@ -365,7 +521,7 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
     def update_specialization(self, new_specialization: str):
         """Update agent specialization based on performance."""
         self.specialization = new_specialization
-        logger.info(f"Updated {self.name} specialization to: {new_specialization}")
+        logger.info("Updated %s specialization to: %s", self.name, new_specialization)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for this dynamic agent."""
@@ -373,27 +529,24 @@ Provide parameters in JSON format suitable for the {tool_name} tool."""
         if not self.execution_history:
             return {"no_executions": True}
         
-        successful_executions = [e for e in self.execution_history if e["success"]]
         total_executions = len(self.execution_history)
+        successful_executions = 0
+        confidence_total = 0.0
+        tool_usage = Counter()
         
-        # Calculate tool usage statistics
-        all_tools_used = []
+        # Single pass over the history for every aggregate
         for execution in self.execution_history:
-            all_tools_used.extend(execution.get("tools_used", []))
-        
-        tool_usage = {}
-        for tool in all_tools_used:
-            tool_usage[tool] = tool_usage.get(tool, 0) + 1
+            if execution.success:
+                successful_executions += 1
+            confidence_total += _CONFIDENCE_WEIGHTS.get(execution.confidence, 0)
+            tool_usage.update(execution.tools_used)
         
         return {
             "total_executions": total_executions,
-            "successful_executions": len(successful_executions),
-            "success_rate": len(successful_executions) / total_executions if total_executions > 0 else 0,
-            "average_confidence": sum(
-                1 if e.get("confidence") == "high" else 0.5 if e.get("confidence") == "medium" else 0
-                for e in self.execution_history
-            ) / total_executions if total_executions > 0 else 0,
-            "most_used_tools": sorted(tool_usage.items(), key=lambda x: x[1], reverse=True)[:3],
+            "successful_executions": successful_executions,
+            "success_rate": successful_executions / total_executions,
+            "average_confidence": confidence_total / total_executions,
+            "most_used_tools": tool_usage.most_common(3),
             "specialization": self.specialization,
             "preferred_tools": self.preferred_tools
         }
@@ -1,14 +1,17 @@
 """Configuration settings for EUNA MVP."""
 
 import os
+from functools import lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
 class Settings(BaseSettings):
     """Application settings."""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
+    
     # GROQ Configuration
     groq_api_key: Optional[str] = Field(default=None, env="GROQ_API_KEY")
     
@@ -22,19 +25,19 @@ class Settings(BaseSettings):
     
     # Application Configuration
     debug: bool = Field(default=True, env="DEBUG")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL").
+    log_level: str = Field(default="INFO", env="LOG_LEVEL")
     max_agents: int = Field(default=10, env="MAX_AGENTS")
     task_timeout: int = Field(default=300, env="TASK_TIMEOUT")
+    max_parallel_tools: int = Field(default=4, env="MAX_PARALLEL_TOOLS")
+    max_tool_calls_per_task: int = Field(default=10, env="MAX_TOOL_CALLS_PER_TASK")
     
     # API Configuration
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
     api_port: int = Field(default=8000, env="API_PORT")
     frontend_port: int = Field(default=8501, env="FRONTEND_PORT")
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loaded once per process."""
+    return Settings()
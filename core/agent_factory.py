@@ -1,9 +1,20 @@
 """Agent factory for creating and managing agents in EUNA MVP."""
 
+import asyncio
+import copy
+import hashlib
+import io
+import json
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
+from config.settings import get_settings
 from services.database_service import db_service
 from services.groq_service import groq_service
 from tools.tool_registry import tool_registry
@@ -11,16 +22,97 @@ from tools.tool_executor import tool_executor
 
 logger = logging.getLogger(__name__)
 
+_MATH_RE = re.compile(r'[\d+\-*/().%\s]+')
+_SEARCH_FOR_RE = re.compile(r'search for\s*([^.]+)\.', re.IGNORECASE)
 
-class AgentFactory:
-    """Factory for creating and managing different types of agents."""
+def _extract_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} substring of text, or None."""
+    start = text.find("{")
+    if start < 0:
+        return None
     
-    def __init__(self):
-        self.default_agent_templates = {
-            "SummarizerAgent": {
-                "role": "Text summarization and key point extraction specialist",
-                "capabilities": ["text_analysis", "summarization", "key_extraction"],
-                "system_prompt": """You are a SummarizerAgent specialized in analyzing and summarizing text content.
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+# Default parameter builders, keyed by tool name
+def _web_search_params(task_input: str, reasoning: Dict[str, Any]) -> Dict[str, Any]:
+    """Build web_search parameters, preferring a "search for ..." phrase from the reasoning."""
+    match = _SEARCH_FOR_RE.search(reasoning.get("reasoning", ""))
+    search_query = match.group(1).strip() if match else task_input
+    
+    return {
+        "query": search_query,
+        "max_results": 5
+    }
+
+
+def _calculator_params(task_input: str, reasoning: Dict[str, Any]) -> Dict[str, Any]:
+    """Build calculator parameters from the first math expression in the task input."""
+    math_patterns = _MATH_RE.findall(task_input)
+    if math_patterns:
+        return {"expression": math_patterns[0].strip()}
+    return {"expression": "1+1"}  # Default safe expression
+
+
+_PARAM_BUILDERS: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+    "web_search": _web_search_params,
+    "calculator": _calculator_params,
+    "text_summarizer": lambda task_input, reasoning: {"text": task_input, "max_sentences": 3},
+    "datetime_tool": lambda task_input, reasoning: {"operation": "now"},
+    "json_parser": lambda task_input, reasoning: {"json_data": _extract_json(task_input) or "{}"}
+}
+
+# One-line summaries of successful tool results, keyed by tool name
+_SUMMARIZERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "web_search": lambda result: f"Found {result.get('total_results', 0)} search results",
+    "calculator": lambda result: f"Calculated: {result.get('result')}",
+    "text_summarizer": lambda result: (
+        f"Created summary ({result.get('summary_length', 0)} chars, "
+        f"{result.get('compression_ratio', 0):.1%} compression)"
+    ),
+    "datetime_tool": lambda result: f"Current time: {result.get('current_datetime', '')}"
+}
+
+
+# Cache prewarming can be disabled (e.g. in tests/CI) with EUNA_PREWARM=0
+PREWARM_ENABLED = os.getenv("EUNA_PREWARM", "1") == "1"
+
+# Tools with side effects or time-dependent output are never served from the run cache
+NO_CACHE_TOOLS = frozenset({"http_request", "file_reader", "datetime_tool"})
+
+
+@lru_cache(maxsize=512)
+def _tools_for(capabilities: Tuple[str, ...], registry_revision: int) -> Tuple[str, ...]:
+    """Registry tools for a capability tuple; the revision key drops stale entries."""
+    return tuple(tool_registry.get_tools_for_capabilities(capabilities))
+
+
+def _build_summarizer_template() -> Dict[str, Any]:
+    """Template for the default SummarizerAgent."""
+    return {
+        "role": "Text summarization and key point extraction specialist",
+        "capabilities": ("text_analysis", "summarization", "key_extraction"),
+        "system_prompt": """You are a SummarizerAgent specialized in analyzing and summarizing text content.
 Your role is to:
 1. Extract key information from long texts
 2. Create concise, accurate summaries
@@ -28,12 +120,16 @@ Your role is to:
 4. Present information in a structured format
 
 Always provide clear, well-organized summaries that capture the essence of the original content.""",
-                "preferred_tools": ["text_summarizer", "json_parser"]
-            },
-            "SearchAgent": {
-                "role": "Web search and information gathering specialist",
-                "capabilities": ["web_search", "information_gathering", "fact_checking"],
-                "system_prompt": """You are a SearchAgent specialized in finding and gathering information from the web.
+        "preferred_tools": ("text_summarizer", "json_parser")
+    }
+
+
+def _build_search_template() -> Dict[str, Any]:
+    """Template for the default SearchAgent."""
+    return {
+        "role": "Web search and information gathering specialist",
+        "capabilities": ("web_search", "information_gathering", "fact_checking"),
+        "system_prompt": """You are a SearchAgent specialized in finding and gathering information from the web.
 Your role is to:
 1. Conduct effective web searches using relevant keywords
 2. Gather comprehensive information from multiple sources
@@ -41,12 +137,16 @@ Your role is to:
 4. Organize findings in a structured format
 
 Always provide reliable, well-sourced information with proper attribution.""",
-                "preferred_tools": ["web_search", "http_request", "json_parser"]
-            },
-            "CodingAgent": {
-                "role": "Code generation, review, and debugging specialist",
-                "capabilities": ["code_generation", "code_review", "debugging", "syntax_checking"],
-                "system_prompt": """You are a CodingAgent specialized in software development tasks.
+        "preferred_tools": ("web_search", "http_request", "json_parser")
+    }
+
+
+def _build_coding_template() -> Dict[str, Any]:
+    """Template for the default CodingAgent."""
+    return {
+        "role": "Code generation, review, and debugging specialist",
+        "capabilities": ("code_generation", "code_review", "debugging", "syntax_checking"),
+        "system_prompt": """You are a CodingAgent specialized in software development tasks.
 Your role is to:
 1. Generate clean, efficient, and well-documented code
 2. Review code for bugs, security issues, and best practices
@@ -54,12 +154,16 @@ Your role is to:
 4. Provide explanations for code functionality
 
 Always follow coding best practices and provide clear explanations.""",
-                "preferred_tools": ["file_reader", "json_parser", "http_request"]
-            },
-            "SchedulerAgent": {
-                "role": "Task scheduling and time management specialist",
-                "capabilities": ["scheduling", "time_management", "calendar_operations"],
-                "system_prompt": """You are a SchedulerAgent specialized in organizing and managing schedules.
+        "preferred_tools": ("file_reader", "json_parser", "http_request")
+    }
+
+
+def _build_scheduler_template() -> Dict[str, Any]:
+    """Template for the default SchedulerAgent."""
+    return {
+        "role": "Task scheduling and time management specialist",
+        "capabilities": ("scheduling", "time_management", "calendar_operations"),
+        "system_prompt": """You are a SchedulerAgent specialized in organizing and managing schedules.
 Your role is to:
 1. Create and manage schedules and timelines
 2. Optimize time allocation for tasks
@@ -67,21 +171,68 @@ Your role is to:
 4. Provide time management recommendations
 
 Always consider time zones, priorities, and dependencies when scheduling.""",
-                "preferred_tools": ["datetime_tool", "calculator", "json_parser"]
-            }
-        }
+        "preferred_tools": ("datetime_tool", "calculator", "json_parser")
+    }
+
+
+# Default templates are materialized on first use and shared by every factory instance
+_TEMPLATE_LOADERS: Mapping[str, Callable[[], Dict[str, Any]]] = MappingProxyType({
+    "SummarizerAgent": _build_summarizer_template,
+    "SearchAgent": _build_search_template,
+    "CodingAgent": _build_coding_template,
+    "SchedulerAgent": _build_scheduler_template,
+})
+_DEFAULT_TEMPLATES: Dict[str, Dict[str, Any]] = {}
+
+
+class AgentFactory:
+    """Factory for creating and managing different types of agents."""
+    
+    TOOL_CACHE_TTL = 300.0
+    TOOL_CACHE_SIZE = 2048
+    
+    def __init__(self):
+        self._template_loaders = _TEMPLATE_LOADERS
+        self._template_cache = _DEFAULT_TEMPLATES
+        self._agent_types_view: Optional[Mapping[str, Dict[str, Any]]] = None
+        self._tool_run_cache: Dict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]] = {}  # key -> (expires_at, result)
+    
+    def _get_template(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a default agent template, building it on first access."""
+        if name not in self._template_cache:
+            loader = self._template_loaders.get(name)
+            if loader is None:
+                return None
+            template = loader()
+            # Templates are shared by every agent built from them, so keep their values immutable
+            template["role"] = sys.intern(template["role"])
+            template["capabilities"] = tuple(map(sys.intern, template["capabilities"]))
+            template["preferred_tools"] = tuple(map(sys.intern, template["preferred_tools"]))
+            self._template_cache[name] = template
+        return self._template_cache[name]
+    
+    def prewarm(self):
+        """Build all default templates and seed the capability-to-tool cache."""
+        if not PREWARM_ENABLED:
+            return
+        
+        for agent_type in self._template_loaders:
+            template = self._get_template(agent_type)
+            # Tool mappings depend on what is registered; skip them until the registry is populated
+            if tool_registry.tools:
+                _tools_for(tuple(template["capabilities"]), tool_registry.revision)
     
     async def create_default_agent(self, task_id: int, agent_type: str, role: str) -> Dict[str, Any]:
         """Create a default agent of specified type."""
         
-        template = self.default_agent_templates.get(agent_type)
+        template = self._get_template(agent_type)
         if not template:
             # Create generic agent if type not found
             template = {
                 "role": role,
-                "capabilities": ["general_reasoning"],
+                "capabilities": ("general_reasoning",),
                 "system_prompt": f"You are a {agent_type} agent. {role}",
-                "preferred_tools": ["web_search", "calculator"]
+                "preferred_tools": ("web_search", "calculator")
             }
         
         # Create agent in database
@@ -139,53 +290,64 @@ Always consider time zones, priorities, and dependencies when scheduling.""",
             "priority": "high"  # Dynamic agents typically have higher priority
         }
     
-    async def execute_agent(self, agent_id: int, task_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute an agent with given input and context."""
+    async def execute_agent(self, agent_id: int, task_input: str, context: Dict[str, Any],
+                            context_json: Optional[str] = None) -> Dict[str, Any]:
+        """Execute an agent with given input and context; context_json is a pre-serialized prompt form of it."""
         
+        status_write = None
+        agent_name = "unknown"
         try:
             # Get agent details from database
-            agents = await db_service.get_task_agents(task_id=None)  # We'll filter by agent_id
-            agent = None
-            for a in agents:
-                if a.id == agent_id:
-                    agent = a
-                    break
+            agent = await db_service.get_agent_row(agent_id)
             
             if not agent:
                 raise ValueError(f"Agent {agent_id} not found")
+            agent_name = agent.name
             
-            # Update agent status
-            await db_service.update_agent_status(agent_id, "active")
+            # The "active" status is advisory, so write it in the background
+            status_write = asyncio.create_task(db_service.update_agent_status(agent_id, "active"))
             
             # Get agent's preferred tools
-            capabilities = agent.capabilities or []
-            preferred_tools = tool_registry.get_tools_for_capabilities(capabilities)
+            capabilities = agent.capabilities
+            preferred_tools = _tools_for(tuple(capabilities), tool_registry.revision)
             
             # Execute agent reasoning using GROQ
             reasoning_result = await groq_service.execute_agent_reasoning(
                 agent_prompt=agent.prompt_template,
                 task_input=task_input,
                 context=context,
-                tools_available=preferred_tools
+                tools_available=preferred_tools,
+                context_json=context_json
             )
             
-            # Execute planned actions using tools
-            tool_results = []
+            # Execute planned actions using tools; the tools are independent, so run them concurrently
             planned_actions = reasoning_result.get("planned_actions", [])
             tools_needed = reasoning_result.get("tools_needed", [])
             
-            for tool_name in tools_needed:
-                if tool_name in [tool.name for tool in tool_registry.tools.values()]:
-                    # Determine tool parameters based on context and reasoning
-                    tool_params = await self._determine_tool_parameters(
-                        tool_name, task_input, context, reasoning_result
-                    )
-                    
-                    # Execute tool
-                    tool_result = await tool_executor.execute_single_tool(
-                        agent_id, tool_name, tool_params
-                    )
-                    tool_results.append(tool_result)
+            available_tools = tool_registry.tool_names
+            tool_names = [name for name in tools_needed if name in available_tools]
+            semaphore = asyncio.Semaphore(get_settings().max_parallel_tools)
+            outcomes = await asyncio.gather(
+                *(self._run_one_tool(agent_id, tool_name, task_input, context, reasoning_result, semaphore)
+                  for tool_name in tool_names),
+                return_exceptions=True
+            )
+            
+            # One pass collects the results, the successful tool names and their summary lines
+            tool_results = []
+            tools_used = []
+            tool_summary = io.StringIO()
+            for tool_name, tool_result in zip(tool_names, outcomes):
+                if isinstance(tool_result, Exception):
+                    tool_result = {
+                        "success": False,
+                        "tool_name": tool_name,
+                        "result": None,
+                        "error": str(tool_result)
+                    }
+                tool_results.append(tool_result)
+                if self._process_tool_result(tool_result, tool_summary):
+                    tools_used.append(tool_result["tool_name"])
             
             # Compile agent result
             agent_result = {
@@ -195,15 +357,15 @@ Always consider time zones, priorities, and dependencies when scheduling.""",
                 "agent_type": agent.agent_type,
                 "reasoning": reasoning_result.get("reasoning", ""),
                 "planned_actions": planned_actions,
-                "tools_used": [r["tool_name"] for r in tool_results if r["success"]],
+                "tools_used": tools_used,
                 "tool_results": tool_results,
                 "confidence_level": reasoning_result.get("confidence_level", "medium"),
-                "output": self._synthesize_agent_output(reasoning_result, tool_results),
+                "output": self._synthesize_agent_output(reasoning_result, tool_summary.getvalue()),
                 "next_steps": reasoning_result.get("next_steps", [])
             }
             
             # Update agent status
-            await db_service.update_agent_status(agent_id, "completed")
+            await self._finalize_agent(agent_id, "completed", status_write)
             
             logger.info(f"Agent {agent.name} executed successfully")
             return agent_result
@@ -212,12 +374,12 @@ Always consider time zones, priorities, and dependencies when scheduling.""",
             logger.error(f"Error executing agent {agent_id}: {e}")
             
             # Update agent status
-            await db_service.update_agent_status(agent_id, "failed")
+            await self._finalize_agent(agent_id, "failed", status_write)
             
             return {
                 "success": False,
                 "agent_id": agent_id,
-                "agent_name": agent.name if 'agent' in locals() else "unknown",
+                "agent_name": agent_name,
                 "error": str(e),
                 "reasoning": "Agent execution failed due to error",
                 "tools_used": [],
@@ -225,94 +387,108 @@ Always consider time zones, priorities, and dependencies when scheduling.""",
                 "confidence_level": "low"
             }
     
+    async def _finalize_agent(self, agent_id: int, status: str, status_write: Optional[asyncio.Task]):
+        """Write an agent's terminal status once the background "active" write has landed."""
+        
+        if status_write is not None:
+            try:
+                await status_write
+            except Exception as e:
+                logger.warning(f"Background status update for agent {agent_id} failed: {e}")
+        await db_service.finalize_agent(agent_id, status)
+    
+    async def _run_one_tool(self, agent_id: int, tool_name: str, task_input: str,
+                            context: Dict[str, Any], reasoning: Dict[str, Any],
+                            semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Determine parameters for a tool and execute it, reusing a recent identical successful run."""
+        
+        async with semaphore:
+            # Determine tool parameters based on context and reasoning
+            tool_params = await self._determine_tool_parameters(
+                tool_name, task_input, context, reasoning
+            )
+            
+            if tool_name in NO_CACHE_TOOLS:
+                return await tool_executor.execute_single_tool(agent_id, tool_name, tool_params)
+            
+            key = (tool_name, hashlib.blake2b(
+                json.dumps(tool_params, sort_keys=True, default=str).encode(), digest_size=16
+            ).digest())
+            now = time.monotonic()
+            cached = self._tool_run_cache.get(key)
+            if cached is not None and cached[0] > now:
+                # Callers attach and mutate results; never share the cached payload.
+                # A hit bypasses tool_executor, so it records no AgentExecution row or usage stats
+                return copy.deepcopy(cached[1])
+            
+            tool_result = await tool_executor.execute_single_tool(agent_id, tool_name, tool_params)
+            if tool_result.get("success"):
+                cache = self._tool_run_cache
+                cache.pop(key, None)
+                if len(cache) >= self.TOOL_CACHE_SIZE:
+                    # Evict the oldest insertion
+                    del cache[next(iter(cache))]
+                cache[key] = (time.monotonic() + self.TOOL_CACHE_TTL, copy.deepcopy(tool_result))
+            return tool_result
+    
     async def _determine_tool_parameters(self, tool_name: str, task_input: str, 
                                        context: Dict[str, Any], reasoning: Dict[str, Any]) -> Dict[str, Any]:
         """Determine appropriate parameters for tool execution."""
         
-        # Basic parameter determination based on tool type and context
-        params = {}
-        
-        if tool_name == "web_search":
-            # Extract search query from task input or reasoning
-            search_query = task_input
-            if "search" in reasoning.get("reasoning", "").lower():
-                # Try to extract more specific search terms
-                reasoning_text = reasoning.get("reasoning", "")
-                if "search for" in reasoning_text.lower():
-                    start = reasoning_text.lower().find("search for") + 10
-                    end = reasoning_text.find(".", start)
-                    if end > start:
-                        search_query = reasoning_text[start:end].strip()
-            
-            params = {
-                "query": search_query,
-                "max_results": 5
-            }
-        
-        elif tool_name == "calculator":
-            # Look for mathematical expressions in task input
-            import re
-            math_patterns = re.findall(r'[\d+\-*/().%\s]+', task_input)
-            if math_patterns:
-                params = {"expression": math_patterns[0].strip()}
-            else:
-                params = {"expression": "1+1"}  # Default safe expression
-        
-        elif tool_name == "text_summarizer":
-            params = {
-                "text": task_input,
-                "max_sentences": 3
-            }
-        
-        elif tool_name == "datetime_tool":
-            params = {"operation": "now"}
-        
-        elif tool_name == "json_parser":
-            # Look for JSON-like content in task input
-            if "{" in task_input and "}" in task_input:
-                start = task_input.find("{")
-                end = task_input.rfind("}") + 1
-                json_content = task_input[start:end]
-                params = {"json_data": json_content}
-            else:
-                params = {"json_data": "{}"}
-        
-        else:
+        builder = _PARAM_BUILDERS.get(tool_name)
+        if builder is None:
             # Generic parameters
-            params = {"input": task_input}
+            return {"input": task_input}
+        return builder(task_input, reasoning)
+    
+    def _process_tool_result(self, tool_result: Dict[str, Any], buf: io.StringIO) -> bool:
+        """Write the summary line of a successful tool result to buf; return whether it succeeded."""
         
-        return params
+        if not tool_result["success"]:
+            return False
+        
+        buf.write("- ")
+        buf.write(tool_result["tool_name"])
+        buf.write(": ")
+        buf.write(self._summarize_tool_result(tool_result))
+        buf.write("\n\n")
+        return True
     
-    def _synthesize_agent_output(self, reasoning: Dict[str, Any], tool_results: List[Dict[str, Any]]) -> str:
-        """Synthesize agent output from reasoning and tool results."""
+    def _synthesize_agent_output(self, reasoning: Dict[str, Any], tool_summary: str) -> str:
+        """Synthesize agent output from reasoning and the pre-rendered tool summary lines."""
         
-        output_parts = []
+        # Every section is written followed by a blank-line separator; the last one is trimmed
+        buf = io.StringIO()
+        write = buf.write
         
         # Add reasoning summary
         if reasoning.get("reasoning"):
-            output_parts.append(f"Analysis: {reasoning['reasoning']}")
+            write("Analysis: ")
+            write(str(reasoning["reasoning"]))
+            write("\n\n")
         
         # Add tool results summary
-        successful_tools = [r for r in tool_results if r["success"]]
-        if successful_tools:
-            output_parts.append("Tool Results:")
-            for tool_result in successful_tools:
-                tool_name = tool_result["tool_name"]
-                result_summary = self._summarize_tool_result(tool_result)
-                output_parts.append(f"- {tool_name}: {result_summary}")
+        if tool_summary:
+            write("Tool Results:\n\n")
+            write(tool_summary)
         
         # Add expected outcome
         if reasoning.get("expected_outcome"):
-            output_parts.append(f"Expected Outcome: {reasoning['expected_outcome']}")
+            write("Expected Outcome: ")
+            write(str(reasoning["expected_outcome"]))
+            write("\n\n")
         
         # Add next steps if any
         next_steps = reasoning.get("next_steps", [])
         if next_steps:
-            output_parts.append("Next Steps:")
+            write("Next Steps:\n\n")
             for step in next_steps:
-                output_parts.append(f"- {step}")
+                write("- ")
+                write(str(step))
+                write("\n\n")
         
-        return "\n\n".join(output_parts) if output_parts else "Agent completed processing."
+        output = buf.getvalue()
+        return output[:-2] if output else "Agent completed processing."
     
     def _summarize_tool_result(self, tool_result: Dict[str, Any]) -> str:
         """Create a brief summary of tool result."""
@@ -320,49 +496,36 @@ Always consider time zones, priorities, and dependencies when scheduling.""",
         if not tool_result["success"]:
             return f"Failed - {tool_result.get('error', 'Unknown error')}"
         
-        result = tool_result.get("result", {})
-        tool_name = tool_result["tool_name"]
-        
-        if tool_name == "web_search":
-            total_results = result.get("total_results", 0)
-            return f"Found {total_results} search results"
-        
-        elif tool_name == "calculator":
-            calc_result = result.get("result")
-            return f"Calculated: {calc_result}"
-        
-        elif tool_name == "text_summarizer":
-            summary_length = result.get("summary_length", 0)
-            compression = result.get("compression_ratio", 0)
-            return f"Created summary ({summary_length} chars, {compression:.1%} compression)"
-        
-        elif tool_name == "datetime_tool":
-            current_time = result.get("current_datetime", "")
-            return f"Current time: {current_time[:19]}"  # Remove microseconds
-        
-        else:
+        summarizer = _SUMMARIZERS.get(tool_result["tool_name"])
+        if summarizer is None:
             return "Completed successfully"
+        return summarizer(tool_result.get("result", {}))
     
-    async def get_agent_capabilities(self, agent_type: str) -> List[str]:
+    async def get_agent_capabilities(self, agent_type: str) -> Sequence[str]:
         """Get capabilities for a specific agent type."""
         
-        template = self.default_agent_templates.get(agent_type)
+        template = self._get_template(agent_type)
         if template:
             return template["capabilities"]
         
-        return ["general_reasoning"]
+        return ("general_reasoning",)
     
-    async def list_available_agent_types(self) -> Dict[str, Dict[str, Any]]:
+    async def list_available_agent_types(self) -> Mapping[str, Dict[str, Any]]:
         """List all available default agent types."""
         
-        return {
-            agent_type: {
-                "role": template["role"],
-                "capabilities": template["capabilities"],
-                "description": template["system_prompt"][:100] + "..."
-            }
-            for agent_type, template in self.default_agent_templates.items()
-        }
+        # Templates never change once built, so the descriptor view is built once
+        if self._agent_types_view is None:
+            agent_types = {}
+            for agent_type in self._template_loaders:
+                template = self._get_template(agent_type)
+                agent_types[agent_type] = {
+                    "role": template["role"],
+                    "capabilities": template["capabilities"],
+                    "description": template["system_prompt"][:100] + "..."
+                }
+            self._agent_types_view = MappingProxyType(agent_types)
+        
+        return self._agent_types_view
 
 
 # Global agent factory instance
@@ -2,7 +2,11 @@
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import graphlib
+import json
+import time
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 import uuid
 
@@ -10,10 +14,27 @@ from services.database_service import db_service
 from services.groq_service import groq_service
 from services.memory_service import memory_service
 from tools.tool_executor import tool_executor
+from tools.tool_registry import tool_registry
 from core.agent_factory import agent_factory
+from core.plan_validator import validate_plan
+from core.task_manager import task_manager
 
 logger = logging.getLogger(__name__)
 
+# Task logs are buffered per task and written in one INSERT after a short delay or once enough pile up
+LOG_FLUSH_DELAY = 0.1
+LOG_FLUSH_SIZE = 32
+
+# Finished tasks stay in active_tasks for TASK_RETENTION seconds; the reaper sweeps every REAP_INTERVAL
+TASK_RETENTION = 300.0
+REAP_INTERVAL = 30.0
+
+# Retry delay after a failed claim of pending tasks doubles up to this many seconds
+DISPATCH_MAX_BACKOFF = 30.0
+
+# Tasks in these states no longer change, so their status projection is memoized
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 class TaskOrchestrator:
     """Master orchestrator that coordinates agents and manages task execution."""
@@ -21,50 +42,191 @@ class TaskOrchestrator:
     def __init__(self):
         self.active_tasks: Dict[int, Dict] = {}
         self.task_queue: List[Dict] = []
-        self.max_concurrent_tasks = 5
+        self.max_concurrent_agents = 16
+        
+        # Secondary index of active_tasks by execution status, maintained by _set_status
+        self._tasks_by_status: Dict[str, Set[int]] = defaultdict(set)
+        self._in_progress: Set[int] = self._tasks_by_status["in_progress"]  # Live view of the index entry
+        
+        # Bound how many agents run at once across all tasks; running tasks each hold an admission slot
+        self._agent_sem = asyncio.Semaphore(self.max_concurrent_agents)
+        self._admission = task_manager.admission
+        
+        self._log_buffers: Dict[int, List[Dict[str, Any]]] = {}
+        self._log_flush_handles: Dict[int, asyncio.TimerHandle] = {}
+        self._log_flush_tasks: Set[asyncio.Task] = set()
+        self._reaper: Optional[asyncio.Task] = None
+        
+        # Submitted tasks wait as pending rows; the dispatcher claims them in batches as slots free up
+        self._dispatch_event = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+    
+    @property
+    def max_concurrent_tasks(self) -> int:
+        return self._admission.max_concurrent
+    
+    async def set_max_concurrent_tasks(self, max_concurrent: int):
+        """Resize the running task limit; a larger limit starts pending tasks right away."""
+        await self._admission.set_max_concurrent(max_concurrent)
+        self._dispatch_event.set()
+    
+    def _ensure_background_loops(self):
+        """Start the dispatcher and the finished-task reaper if they are not running."""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+    
+    async def _dispatch_loop(self):
+        """Start pending tasks, highest priority first, whenever execution slots are free."""
+        claim_failures = 0
+        while True:
+            await self._dispatch_event.wait()
+            self._dispatch_event.clear()
+            
+            slots = self._admission.available
+            pending = self._tasks_by_status.get("pending")
+            if slots <= 0 or not pending:
+                continue
+            
+            try:
+                task_ids = await db_service.pop_next_batch(slots, list(pending))
+            except Exception as e:
+                claim_failures += 1
+                # Log the 1st, 2nd, 4th, 8th... consecutive failure rather than every retry
+                if claim_failures & (claim_failures - 1) == 0:
+                    logger.error(f"Error claiming pending tasks ({claim_failures} consecutive failures): {e}")
+                await asyncio.sleep(min(2 ** (claim_failures - 1), DISPATCH_MAX_BACKOFF))
+                self._dispatch_event.set()
+                continue
+            
+            if claim_failures:
+                logger.info(f"Claiming pending tasks recovered after {claim_failures} failures")
+                claim_failures = 0
+            
+            for task_id in task_ids:
+                # Free slots were counted above, so this only waits if the limit shrank meanwhile
+                await self._admission.acquire_slot()
+                runner = asyncio.create_task(self._run_admitted(task_id))
+                self._running.add(runner)
+                runner.add_done_callback(self._on_task_done)
+    
+    async def _run_admitted(self, task_id: int):
+        """Execute a task, returning its admission slot when it finishes."""
+        try:
+            await self._execute_task(task_id)
+        finally:
+            await self._admission.release_slot()
+    
+    def _on_task_done(self, runner: asyncio.Task):
+        """Forget a finished task and wake the dispatcher to fill its slot."""
+        self._running.discard(runner)
+        self._dispatch_event.set()
+    
+    async def _reap_loop(self):
+        """Periodically drop finished tasks whose retention period has passed."""
+        while True:
+            await asyncio.sleep(REAP_INTERVAL)
+            cutoff = time.monotonic() - TASK_RETENTION
+            expired = [
+                task_id for task_id, execution_plan in self.active_tasks.items()
+                if execution_plan.get("completed_at") is not None and execution_plan["completed_at"] < cutoff
+            ]
+            for task_id in expired:
+                execution_plan = self.active_tasks.pop(task_id)
+                self._tasks_by_status[execution_plan["status"]].discard(task_id)
+    
+    def _set_status(self, task_id: int, status: str):
+        """Set a tracked task's execution status and keep the status index in step."""
+        execution_plan = self.active_tasks[task_id]
+        self._tasks_by_status[execution_plan["status"]].discard(task_id)
+        execution_plan["status"] = status
+        self._tasks_by_status[status].add(task_id)
+    
+    def _enqueue_log(self, task_id: int, level: str, message: str, metadata: Optional[Dict] = None):
+        """Buffer a task log entry for the next bulk flush."""
+        buffer = self._log_buffers.setdefault(task_id, [])
+        buffer.append({
+            "task_id": task_id,
+            "level": level,
+            "message": message,
+            "log_metadata": metadata,
+            "timestamp": time.time_ns()  # Converted to a datetime when the buffer is written
+        })
+        
+        if len(buffer) >= LOG_FLUSH_SIZE:
+            self._start_log_flush(task_id)
+        elif task_id not in self._log_flush_handles:
+            self._log_flush_handles[task_id] = asyncio.get_running_loop().call_later(
+                LOG_FLUSH_DELAY, self._start_log_flush, task_id
+            )
+    
+    def _start_log_flush(self, task_id: int):
+        """Flush a task's buffered logs in the background."""
+        flush = asyncio.create_task(self._flush_logs(task_id))
+        self._log_flush_tasks.add(flush)
+        flush.add_done_callback(self._log_flush_tasks.discard)
+    
+    def _take_logs(self, task_id: int) -> List[Dict[str, Any]]:
+        """Remove and return a task's buffered logs as DB rows, cancelling its pending flush."""
+        handle = self._log_flush_handles.pop(task_id, None)
+        if handle is not None:
+            handle.cancel()
+        
+        rows = self._log_buffers.pop(task_id, None) or []
+        for row in rows:
+            row["timestamp"] = datetime.utcfromtimestamp(row["timestamp"] / 1e9)
+        return rows
+    
+    async def _flush_logs(self, task_id: int):
+        """Write all buffered logs for a task in one round-trip."""
+        rows = self._take_logs(task_id)
+        if not rows:
+            return
+        
+        try:
+            await db_service.add_task_logs_bulk(rows)
+        except Exception as e:
+            logger.error(f"Error flushing {len(rows)} logs for task {task_id}: {e}")
+    
+    async def _complete_task(self, task_id: int, status: str, level: str, message: str,
+                             metadata: Optional[Dict] = None, result: Optional[Dict] = None,
+                             error_message: Optional[str] = None):
+        """Write a terminal status together with the task's buffered logs and final log entry."""
+        self._enqueue_log(task_id=task_id, level=level, message=message, metadata=metadata)
+        await db_service.complete_task(
+            task_id, status, result=result, error_message=error_message,
+            log_rows=self._take_logs(task_id)
+        )
     
     async def submit_task(self, user_input: str, session_id: Optional[str] = None, 
                          priority: str = "medium") -> Dict[str, Any]:
         """Submit a new task for processing."""
         
         try:
-            # Create task in database (returns dict)
-            task = await db_service.create_task(user_input, priority)
+            # Create task in database (returns dict) while getting context from memory;
+            # the lookup does not need the new id, so the insert stays off the critical path
+            task, context = await asyncio.gather(
+                db_service.create_task(user_input, priority),
+                memory_service.get_context_for_task(user_input, include_task_memories=True)
+            )
             task_id = task["id"]
             
             # Log task submission
-            await db_service.add_task_log(
+            self._enqueue_log(
                 task_id=task_id,
                 level="INFO",
                 message=f"Task submitted: {user_input[:100]}...",
                 metadata={"session_id": session_id}
             )
             
-            # Get context from memory
-            context = await memory_service.get_context_for_task(user_input, task_id)
-            
-            # Analyze task using GROQ
-            logger.info(f"Analyzing task {task_id}")
-            task_analysis = await groq_service.analyze_task(user_input, context)
+            # Analyze the task and track its plan as pending
+            task_analysis = await self._plan_task(task_id, user_input, context, session_id)
             
-            # Create task execution plan
-            execution_plan = {
-                "task_id": task_id,
-                "user_input": user_input,
-                "analysis": task_analysis,
-                "context": context,
-                "session_id": session_id,
-                "status": "pending",
-                "created_at": datetime.now(),
-                "agents": [],
-                "results": []
-            }
-            
-            # Add to active tasks
-            self.active_tasks[task_id] = execution_plan
-            
-            # Start task execution asynchronously
-            asyncio.create_task(self._execute_task(task_id))
+            # Queue for execution; the dispatcher starts it when a slot is free
+            self._ensure_background_loops()
+            self._dispatch_event.set()
             
             logger.info(f"Task {task_id} submitted and queued for execution")
             
@@ -79,6 +241,67 @@ class TaskOrchestrator:
             logger.error(f"Error submitting task: {e}")
             raise
     
+    async def _plan_task(self, task_id: int, user_input: str, context: Dict[str, Any],
+                         session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze a task, validate its plan and track it as pending; return the analysis."""
+        
+        # Analyze task using GROQ
+        logger.info(f"Analyzing task {task_id}")
+        task_analysis = await groq_service.analyze_task(user_input, context)
+        
+        # Prune agents that could not run before paying for their creation
+        task_analysis, plan_issues = validate_plan(task_analysis, tool_registry.tool_names)
+        if plan_issues:
+            logger.warning(f"Task {task_id} plan had {len(plan_issues)} issue(s)")
+            self._enqueue_log(
+                task_id=task_id,
+                level="WARNING",
+                message=f"Plan validation adjusted the task analysis ({len(plan_issues)} issue(s))",
+                metadata={"issues": plan_issues}
+            )
+        
+        # Create task execution plan
+        execution_plan = {
+            "task_id": task_id,
+            "user_input": user_input,
+            "analysis": task_analysis,
+            "context": context,
+            "session_id": session_id,
+            "status": "pending",
+            "created_at": datetime.now(),
+            "agents": [],
+            "results": [],
+            "cancel_event": asyncio.Event()
+        }
+        
+        # Add to active tasks
+        self.active_tasks[task_id] = execution_plan
+        self._tasks_by_status["pending"].add(task_id)
+        
+        return task_analysis
+    
+    async def recover_pending_tasks(self) -> int:
+        """Plan and queue tasks left pending in the database, e.g. by a restart; return how many."""
+        
+        orphans = [row for row in await db_service.get_pending_tasks() if row["id"] not in self.active_tasks]
+        if not orphans:
+            return 0
+        
+        async def recover(row: Dict[str, Any]):
+            context = await memory_service.get_context_for_task(row["user_input"], include_task_memories=True)
+            await self._plan_task(row["id"], row["user_input"], context)
+        
+        outcomes = await asyncio.gather(*(recover(row) for row in orphans), return_exceptions=True)
+        for row, outcome in zip(orphans, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error recovering pending task {row['id']}: {outcome}")
+        
+        self._ensure_background_loops()
+        self._dispatch_event.set()
+        
+        logger.info(f"Recovered {len(orphans)} pending task(s)")
+        return len(orphans)
+    
     async def _execute_task(self, task_id: int):
         """Execute a task using the orchestrated agent approach."""
         
@@ -87,12 +310,17 @@ class TaskOrchestrator:
             logger.error(f"Task {task_id} not found in active tasks")
             return
         
+        # cancel_task sets this event; each expensive stage checks it first and stops quietly
+        cancel_event = execution_plan["cancel_event"]
+        
         try:
-            # Update task status
-            await db_service.update_task_status(task_id, "in_progress")
-            execution_plan["status"] = "in_progress"
+            if cancel_event.is_set():
+                return
             
-            await db_service.add_task_log(
+            # The dispatcher already marked the task in_progress in the database
+            self._set_status(task_id, "in_progress")
+            
+            self._enqueue_log(
                 task_id=task_id,
                 level="INFO",
                 message="Task execution started"
@@ -101,58 +329,67 @@ class TaskOrchestrator:
             # Create agents based on analysis
             agents = await self._create_agents_for_task(task_id, execution_plan)
             execution_plan["agents"] = agents
+            if cancel_event.is_set():
+                return
             
             # Execute agents
-            agent_results = await self._execute_agents(task_id, agents)
+            # Every agent prompt embeds the same context, so serialize it once per task
+            context = execution_plan.get("context") or {}
+            shared_ctx_json = json.dumps(context, indent=2, default=str) if context else None
+            agent_results = await self._execute_agents(
+                task_id, agents, context, shared_ctx_json, cancel_event
+            )
             execution_plan["results"] = agent_results
+            if cancel_event.is_set():
+                return
             
             # Synthesize final result
             final_result = await groq_service.synthesize_results(
                 agent_results, execution_plan["user_input"]
             )
-            
-            # Store result and update status
-            await db_service.update_task_status(
-                task_id, "completed", result=final_result
+            if cancel_event.is_set():
+                return
+            
+            # Store result and update status along with the execution logs, and store
+            # in memory for future reference; the two writes are independent
+            await asyncio.gather(
+                self._complete_task(
+                    task_id, "completed",
+                    level="INFO",
+                    message="Task execution completed successfully",
+                    metadata={"confidence_score": final_result.get("confidence_score")},
+                    result=final_result
+                ),
+                memory_service.store_task_result(
+                    task_id, execution_plan["user_input"], final_result
+                )
             )
-            execution_plan["status"] = "completed"
+            self._set_status(task_id, "completed")
             execution_plan["final_result"] = final_result
             
-            # Store in memory for future reference
-            await memory_service.store_task_result(
-                task_id, execution_plan["user_input"], final_result
-            )
-            
-            await db_service.add_task_log(
-                task_id=task_id,
-                level="INFO",
-                message="Task execution completed successfully",
-                metadata={"confidence_score": final_result.get("confidence_score")}
-            )
-            
             logger.info(f"Task {task_id} completed successfully")
-            
+        
         except Exception as e:
             logger.error(f"Error executing task {task_id}: {e}")
+            if cancel_event.is_set():
+                return  # Already recorded as cancelled
             
             # Update task with error
-            await db_service.update_task_status(
-                task_id, "failed", error_message=str(e)
-            )
-            execution_plan["status"] = "failed"
-            execution_plan["error"] = str(e)
-            
-            await db_service.add_task_log(
-                task_id=task_id,
+            await self._complete_task(
+                task_id, "failed",
                 level="ERROR",
-                message=f"Task execution failed: {str(e)}"
+                message=f"Task execution failed: {str(e)}",
+                error_message=str(e)
             )
+            self._set_status(task_id, "failed")
+            execution_plan["error"] = str(e)
         
         finally:
-            # Clean up active task after some time
-            await asyncio.sleep(300)  # Keep for 5 minutes
-            if task_id in self.active_tasks:
-                del self.active_tasks[task_id]
+            # Keep a status stub for TASK_RETENTION seconds (the reaper removes it) and release the bulk now
+            execution_plan["completed_at"] = time.monotonic()
+            execution_plan.pop("context", None)
+            execution_plan.pop("results", None)
+            execution_plan.pop("agents", None)
     
     async def _create_agents_for_task(self, task_id: int, execution_plan: Dict) -> List[Dict]:
         """Create agents based on task analysis."""
@@ -182,9 +419,12 @@ class TaskOrchestrator:
                         role=agent_spec.get("role", "General task processing")
                     )
                 
+                # depends_on refers to suggested agent names, which dynamic agents may not keep
+                agent["spec_name"] = agent_spec.get("name", agent["name"])
+                agent["depends_on"] = agent_spec.get("depends_on", [])
                 agents.append(agent)
                 
-                await db_service.add_task_log(
+                self._enqueue_log(
                     task_id=task_id,
                     level="INFO",
                     message=f"Created agent: {agent['name']} ({agent['type']})"
@@ -192,7 +432,7 @@ class TaskOrchestrator:
                 
             except Exception as e:
                 logger.error(f"Error creating agent {agent_spec.get('name')}: {e}")
-                await db_service.add_task_log(
+                self._enqueue_log(
                     task_id=task_id,
                     level="WARNING",
                     message=f"Failed to create agent {agent_spec.get('name')}: {str(e)}"
@@ -200,93 +440,132 @@ class TaskOrchestrator:
         
         return agents
     
-    async def _execute_agents(self, task_id: int, agents: List[Dict]) -> List[Dict]:
-        """Execute all agents for a task."""
-        
-        agent_results = []
-        
-        # Determine execution strategy based on agent dependencies
-        high_priority_agents = [a for a in agents if a.get("priority") == "high"]
-        other_agents = [a for a in agents if a.get("priority") != "high"]
-        
-        # Execute high priority agents first
-        for agent in high_priority_agents:
-            result = await self._execute_single_agent(task_id, agent)
-            agent_results.append(result)
-        
-        # Execute remaining agents (can be parallel for independent agents)
-        if other_agents:
-            if len(other_agents) == 1:
-                result = await self._execute_single_agent(task_id, other_agents[0])
-                agent_results.append(result)
-            else:
-                # Execute in parallel
-                tasks = [
-                    self._execute_single_agent(task_id, agent)
-                    for agent in other_agents
-                ]
-                parallel_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in parallel_results:
-                    if isinstance(result, Exception):
-                        agent_results.append({
-                            "success": False,
-                            "error": str(result),
-                            "agent_name": "unknown"
-                        })
-                    else:
-                        agent_results.append(result)
+    async def _execute_agents(self, task_id: int, agents: List[Dict], context: Dict[str, Any],
+                              shared_ctx_json: Optional[str], cancel_event: asyncio.Event) -> List[Dict]:
+        """Execute all agents for a task, one dependency layer at a time."""
+        
+        # Build the dependency graph over agent positions from each agent's declared depends_on names
+        index_by_name = {agent.get("spec_name", agent["name"]): i for i, agent in enumerate(agents)}
+        graph = {
+            i: {index_by_name[name] for name in agent.get("depends_on", ())
+                if name in index_by_name and index_by_name[name] != i}
+            for i, agent in enumerate(agents)
+        }
+        
+        sorter = graphlib.TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as e:
+            logger.warning(f"Dependency cycle among agents for task {task_id}, running them in parallel: {e}")
+            graph = {i: set() for i in graph}
+            sorter = graphlib.TopologicalSorter(graph)
+            sorter.prepare()
+        
+        agent_results: List[Optional[Dict]] = [None] * len(agents)
+        
+        # Every agent in a layer has all of its prerequisites done, so the layer runs in parallel
+        while sorter.is_active() and not cancel_event.is_set():
+            ready = sorter.get_ready()
+            async with asyncio.TaskGroup() as tg:
+                layer = {
+                    i: tg.create_task(
+                        self._safe_exec(
+                            task_id, agents[i], context, shared_ctx_json,
+                            [agent_results[d] for d in graph[i]]
+                        ),
+                        name=agents[i].get("name", "unknown")
+                    )
+                    for i in ready
+                }
+            
+            for i, agent_task in layer.items():
+                agent_results[i] = agent_task.result()
+                sorter.done(i)
         
         return agent_results
     
-    async def _execute_single_agent(self, task_id: int, agent: Dict) -> Dict[str, Any]:
-        """Execute a single agent."""
+    async def _safe_exec(self, task_id: int, agent: Dict, context: Dict[str, Any],
+                         shared_ctx_json: Optional[str], prerequisite_results: List[Dict]) -> Dict[str, Any]:
+        """Run one agent, recording any error as its result so sibling agents keep running."""
         
         try:
-            agent_id = agent["id"]
-            agent_name = agent["name"]
-            
-            await db_service.add_task_log(
-                task_id=task_id,
-                level="INFO",
-                message=f"Executing agent: {agent_name}"
-            )
-            
-            # Get task details
-            task = await db_service.get_task(task_id)
-            if not task:
-                raise ValueError(f"Task {task_id} not found")
-            
-            # Execute agent using agent factory
-            result = await agent_factory.execute_agent(
-                agent_id=agent_id,
-                task_input=task.user_input,
-                context=self.active_tasks[task_id].get("context", {})
-            )
-            
-            await db_service.add_task_log(
-                task_id=task_id,
-                level="INFO",
-                message=f"Agent {agent_name} completed: {result.get('success', False)}"
+            return await self._execute_single_agent(
+                task_id, agent, context, shared_ctx_json, prerequisite_results
             )
-            
-            return result
-            
         except Exception as e:
-            logger.error(f"Error executing agent {agent.get('name', 'unknown')}: {e}")
-            
-            await db_service.add_task_log(
-                task_id=task_id,
-                level="ERROR",
-                message=f"Agent execution failed: {str(e)}"
-            )
-            
+            logger.error(f"Unhandled error in agent {agent.get('name', 'unknown')}: {e}")
             return {
                 "success": False,
-                "agent_name": agent.get("name", "unknown"),
-                "error": str(e)
+                "error": str(e),
+                "agent_name": agent.get("name", "unknown")
             }
     
+    async def _execute_single_agent(self, task_id: int, agent: Dict, context: Dict[str, Any],
+                                    shared_ctx_json: Optional[str] = None,
+                                    prerequisite_results: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Execute a single agent, passing along the results of the agents it depends on."""
+        
+        async with self._agent_sem:
+            try:
+                agent_id = agent["id"]
+                agent_name = agent["name"]
+                
+                self._enqueue_log(
+                    task_id=task_id,
+                    level="INFO",
+                    message=f"Executing agent: {agent_name}"
+                )
+                
+                # Task input comes from the in-memory plan; only an untracked task needs the database
+                execution_plan = self.active_tasks.get(task_id)
+                if execution_plan is not None:
+                    task_input = execution_plan["user_input"]
+                else:
+                    task = await db_service.get_task(task_id)
+                    if not task:
+                        raise ValueError(f"Task {task_id} not found")
+                    task_input = task.user_input
+                
+                # Only this agent's prerequisite results are encoded per agent; the shared part is reused
+                context_json = shared_ctx_json
+                if prerequisite_results:
+                    context = {**context, "prerequisite_results": prerequisite_results}
+                    if context_json is not None:
+                        context_json += "\nPrerequisite results: " + json.dumps(
+                            prerequisite_results, indent=2, default=str
+                        )
+                
+                # Execute agent using agent factory
+                result = await agent_factory.execute_agent(
+                    agent_id=agent_id,
+                    task_input=task_input,
+                    context=context,
+                    context_json=context_json
+                )
+                
+                self._enqueue_log(
+                    task_id=task_id,
+                    level="INFO",
+                    message=f"Agent {agent_name} completed: {result.get('success', False)}"
+                )
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"Error executing agent {agent.get('name', 'unknown')}: {e}")
+                
+                self._enqueue_log(
+                    task_id=task_id,
+                    level="ERROR",
+                    message=f"Agent execution failed: {str(e)}"
+                )
+                
+                return {
+                    "success": False,
+                    "agent_name": agent.get("name", "unknown"),
+                    "error": str(e)
+                }
+    
     async def get_task_status(self, task_id: int) -> Dict[str, Any]:
         """Get current status of a task."""
         
@@ -294,75 +573,51 @@ class TaskOrchestrator:
         if task_id in self.active_tasks:
             execution_plan = self.active_tasks[task_id]
             
-            # Get latest database info
-            task = await db_service.get_task(task_id)
-            agents = await db_service.get_task_agents(task_id)
-            logs = await db_service.get_task_logs(task_id)
+            # A finished task's projection is final; running tasks are read fresh in one query
+            cached = execution_plan.get("_status_cache")
+            if cached is not None:
+                return cached
             
-            return {
+            # Get latest database info; only the last 10 logs are needed
+            bundle = await db_service.get_task_bundle(task_id, log_limit=10)
+            task = bundle["task"]
+            agents = bundle["agents"]
+            
+            status = {
                 "task_id": task_id,
                 "status": execution_plan["status"],
                 "user_input": execution_plan["user_input"],
                 "analysis": execution_plan.get("analysis", {}),
-                "agents": [
-                    {
-                        "name": agent.name,
-                        "type": agent.agent_type,
-                        "status": agent.status,
-                        "role": agent.role
-                    }
-                    for agent in agents
-                ],
+                "agents": agents,
                 "progress": {
                     "total_agents": len(agents),
-                    "completed_agents": len([a for a in agents if a.status == "completed"]),
-                    "failed_agents": len([a for a in agents if a.status == "failed"])
+                    "completed_agents": sum(1 for a in agents if a["status"] == "completed"),
+                    "failed_agents": sum(1 for a in agents if a["status"] == "failed")
                 },
                 "final_result": execution_plan.get("final_result"),
-                "logs": [
-                    {
-                        "timestamp": log.timestamp.isoformat(),
-                        "level": log.level,
-                        "message": log.message
-                    }
-                    for log in logs[-10:]  # Last 10 logs
-                ],
-                "created_at": task.created_at.isoformat() if task else None,
-                "updated_at": task.updated_at.isoformat() if task else None
+                "logs": bundle["logs"],
+                "created_at": task["created_at"].isoformat() if task else None,
+                "updated_at": task["updated_at"].isoformat() if task and task["updated_at"] else None
             }
+            if execution_plan["status"] in TERMINAL_STATUSES:
+                execution_plan["_status_cache"] = status
+            return status
         
         # Check database for completed tasks
-        task = await db_service.get_task(task_id)
+        bundle = await db_service.get_task_bundle(task_id, log_limit=None)
+        task = bundle["task"]
         if task:
-            agents = await db_service.get_task_agents(task_id)
-            logs = await db_service.get_task_logs(task_id)
-            
             return {
                 "task_id": task_id,
-                "status": task.status,
-                "user_input": task.user_input,
-                "result": task.result,
-                "error_message": task.error_message,
-                "agents": [
-                    {
-                        "name": agent.name,
-                        "type": agent.agent_type,
-                        "status": agent.status,
-                        "role": agent.role
-                    }
-                    for agent in agents
-                ],
-                "logs": [
-                    {
-                        "timestamp": log.timestamp.isoformat(),
-                        "level": log.level,
-                        "message": log.message
-                    }
-                    for log in logs
-                ],
-                "created_at": task.created_at.isoformat(),
-                "updated_at": task.updated_at.isoformat() if task.updated_at else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None
+                "status": task["status"],
+                "user_input": task["user_input"],
+                "result": task["result"],
+                "error_message": task["error_message"],
+                "agents": bundle["agents"],
+                "logs": bundle["logs"],
+                "created_at": task["created_at"].isoformat(),
+                "updated_at": task["updated_at"].isoformat() if task["updated_at"] else None,
+                "completed_at": task["completed_at"].isoformat() if task["completed_at"] else None
             }
         
         return {"error": f"Task {task_id} not found"}
@@ -370,45 +625,30 @@ class TaskOrchestrator:
     async def get_active_agents(self) -> List[Dict[str, Any]]:
         """Get all currently active agents."""
         
-        active_agents = []
-        
-        for task_id, execution_plan in self.active_tasks.items():
-            if execution_plan["status"] == "in_progress":
-                agents = await db_service.get_task_agents(task_id)
-                for agent in agents:
-                    if agent.status == "active":
-                        active_agents.append({
-                            "agent_id": agent.id,
-                            "task_id": task_id,
-                            "name": agent.name,
-                            "type": agent.agent_type,
-                            "role": agent.role,
-                            "created_at": agent.created_at.isoformat()
-                        })
-        
-        return active_agents
+        if not self._in_progress:
+            return []
+        
+        return await db_service.get_active_agents_for_tasks(list(self._in_progress))
     
     async def cancel_task(self, task_id: int) -> Dict[str, Any]:
         """Cancel a running task."""
         
         if task_id in self.active_tasks:
             execution_plan = self.active_tasks[task_id]
-            execution_plan["status"] = "cancelled"
-            
-            # Update database
-            await db_service.update_task_status(task_id, "cancelled")
+            self._set_status(task_id, "cancelled")
+            execution_plan["cancel_event"].set()
             
-            # Update agents
-            agents = await db_service.get_task_agents(task_id)
-            for agent in agents:
-                if agent.status == "active":
-                    await db_service.update_agent_status(agent.id, "cancelled")
-            
-            await db_service.add_task_log(
-                task_id=task_id,
-                level="WARNING",
-                message="Task cancelled by user"
+            # Update the task and all of its active agents together
+            await asyncio.gather(
+                self._complete_task(
+                    task_id, "cancelled",
+                    level="WARNING",
+                    message="Task cancelled by user"
+                ),
+                db_service.cancel_active_agents_for_task(task_id)
             )
+            # The status is set before these writes, so drop any projection memoized in between
+            execution_plan.pop("_status_cache", None)
             
             return {"task_id": task_id, "status": "cancelled"}
         
@@ -0,0 +1,82 @@
+"""Pre-execution validation of task analysis plans for EUNA MVP."""
+
+import graphlib
+import logging
+from typing import Dict, List, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def validate_plan(analysis: Dict[str, Any], available_tools: Iterable[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """Prune invalid agents and dangling references from a task analysis; return it with the issues found."""
+    
+    issues = []
+    
+    # Agents need a unique name to be addressed by depends_on
+    agents = {}
+    for spec in analysis.get("suggested_agents", []):
+        if not isinstance(spec, dict) or not spec.get("name"):
+            issues.append(f"Dropped malformed agent spec: {spec!r}")
+            continue
+        if spec["name"] in agents:
+            issues.append(f"Dropped duplicate agent {spec['name']}")
+            continue
+        agents[spec["name"]] = dict(spec)
+    
+    # Every dependency must name another suggested agent
+    for name, spec in agents.items():
+        depends_on = []
+        for dependency in spec.get("depends_on", []):
+            if dependency in agents and dependency != name:
+                depends_on.append(dependency)
+            else:
+                issues.append(f"Agent {name} depends on unknown agent {dependency}")
+        spec["depends_on"] = depends_on
+    
+    # Break cycles by dropping the dependencies of the agents involved
+    while True:
+        sorter = graphlib.TopologicalSorter({name: spec["depends_on"] for name, spec in agents.items()})
+        try:
+            order = list(sorter.static_order())
+            break
+        except graphlib.CycleError as e:
+            cycle = e.args[1]
+            issues.append(f"Dependency cycle between agents: {' -> '.join(cycle)}")
+            for name in cycle:
+                agents[name]["depends_on"] = []
+    
+    # Declared inputs must be produced by the agent's (surviving) prerequisites
+    dropped = set()
+    for name in order:
+        spec = agents[name]
+        spec["depends_on"] = [d for d in spec["depends_on"] if d not in dropped]
+        inputs = spec.get("inputs")
+        if not inputs:
+            continue
+        
+        produced = set()
+        for dependency in spec["depends_on"]:
+            produced.update(agents[dependency].get("outputs", ()))
+        missing = set(inputs) - produced
+        if missing:
+            issues.append(f"Dropped agent {name}: inputs {sorted(missing)} are not produced by its dependencies")
+            dropped.add(name)
+    
+    validated = dict(analysis)
+    validated["suggested_agents"] = [spec for name, spec in agents.items() if name not in dropped]
+    
+    # Required tools must exist; skip the check while no tools are registered
+    available = set(available_tools)
+    if available and "required_tools" in analysis:
+        required_tools = []
+        for tool_name in analysis["required_tools"]:
+            if tool_name in available:
+                required_tools.append(tool_name)
+            else:
+                issues.append(f"Required tool {tool_name} is not registered")
+        validated["required_tools"] = required_tools
+    
+    if issues:
+        logger.debug(f"Plan validation found {len(issues)} issue(s)")
+    
+    return validated, issues
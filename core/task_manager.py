@@ -2,6 +2,8 @@
 
 import logging
 import asyncio
+import heapq
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from enum import Enum
@@ -28,41 +30,114 @@ class TaskStatus(Enum):
     PAUSED = "paused"
 
 
+@dataclass(slots=True)
+class Workflow:
+    """Execution state of a multi-step task workflow."""
+    
+    task_id: int
+    definition: Dict[str, Any]
+    steps: List[Dict[str, Any]]
+    dependencies: List[int]
+    timeout_minutes: int
+    created_at: datetime
+    timeout_at: datetime
+    # ISO strings formatted once, since progress and timeline polls return them repeatedly
+    created_at_iso: str
+    timeout_at_iso: str
+    status: str = TaskStatus.PENDING.value
+    current_step: int = 0
+    step_results: List[Dict[str, Any]] = field(default_factory=list)
+    completed_steps: int = 0
+    failed_steps: int = 0
+    sum_step_duration: float = 0.0
+    last_step_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    paused_at: Optional[datetime] = None
+    resumed_at: Optional[datetime] = None
+
+
+class AdmissionController:
+    """Resizable limit on concurrently running tasks, kept as a counter under a condition."""
+    
+    def __init__(self, max_concurrent: int):
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self._cmax = max_concurrent
+    
+    @property
+    def max_concurrent(self) -> int:
+        return self._cmax
+    
+    @property
+    def available(self) -> int:
+        """Number of slots that can be taken without waiting."""
+        return max(self._cmax - self._active, 0)
+    
+    async def acquire_slot(self):
+        """Wait for a free slot and take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._cmax)
+            self._active += 1
+    
+    async def release_slot(self):
+        """Return a slot and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+    
+    async def set_max_concurrent(self, max_concurrent: int):
+        """Resize the limit; waiters are re-checked against the new value."""
+        async with self._cond:
+            self._cmax = max_concurrent
+            self._cond.notify_all()
+
+
 class TaskManager:
     """Manager for coordinating and tracking task execution."""
     
     def __init__(self):
         self.task_dependencies: Dict[int, List[int]] = {}
-        self.task_workflows: Dict[int, Dict[str, Any]] = {}
+        self.task_workflows: Dict[int, Workflow] = {}
         self.task_timeouts: Dict[int, datetime] = {}
-        self.max_concurrent_tasks = 10
+        # Completion times of completed workflows, in completion order
+        self._completed_at: Dict[int, datetime] = {}
+        # Shared with the orchestrator, whose dispatcher takes a slot for every task it starts
+        self.admission = AdmissionController(max_concurrent=5)
     
-    async def create_task_workflow(self, task_id: int, workflow_definition: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a workflow for task execution."""
-        
-        workflow = {
-            "task_id": task_id,
-            "definition": workflow_definition,
-            "steps": workflow_definition.get("steps", []),
-            "current_step": 0,
-            "step_results": [],
-            "status": TaskStatus.PENDING.value,
-            "created_at": datetime.now(),
-            "dependencies": workflow_definition.get("dependencies", []),
-            "timeout_minutes": workflow_definition.get("timeout_minutes", 30)
-        }
+    @property
+    def max_concurrent_tasks(self) -> int:
+        return self.admission.max_concurrent
+    
+    async def create_task_workflow(self, task_id: int, workflow_definition: Dict[str, Any]) -> Workflow:
+        """Create a workflow for task execution; the returned workflow is the live tracked object."""
+        
+        created_at = datetime.now()
+        timeout_minutes = workflow_definition.get("timeout_minutes", 30)
+        timeout_time = created_at + timedelta(minutes=timeout_minutes)
+        
+        workflow = Workflow(
+            task_id=task_id,
+            definition=workflow_definition,
+            steps=workflow_definition.get("steps", []),
+            dependencies=workflow_definition.get("dependencies", []),
+            timeout_minutes=timeout_minutes,
+            created_at=created_at,
+            timeout_at=timeout_time,
+            created_at_iso=created_at.isoformat(),
+            timeout_at_iso=timeout_time.isoformat()
+        )
         
         self.task_workflows[task_id] = workflow
+        self._completed_at.pop(task_id, None)
         
         # Set timeout
-        timeout_time = datetime.now() + timedelta(minutes=workflow["timeout_minutes"])
         self.task_timeouts[task_id] = timeout_time
         
         # Record dependencies
-        if workflow["dependencies"]:
-            self.task_dependencies[task_id] = workflow["dependencies"]
+        if workflow.dependencies:
+            self.task_dependencies[task_id] = workflow.dependencies
         
-        logger.info(f"Created workflow for task {task_id} with {len(workflow['steps'])} steps")
+        logger.info(f"Created workflow for task {task_id} with {len(workflow.steps)} steps")
         
         return workflow
     
@@ -74,26 +149,40 @@ class TaskManager:
         if not workflow:
             raise ValueError(f"Workflow not found for task {task_id}")
         
-        if step_index >= len(workflow["steps"]):
+        if step_index >= len(workflow.steps):
             raise ValueError(f"Step index {step_index} out of range")
         
-        step = workflow["steps"][step_index]
+        step = workflow.steps[step_index]
+        executed_at = datetime.now()
         step_result = {
             "step_index": step_index,
             "step_name": step.get("name", f"Step {step_index}"),
             "agent_result": agent_result,
-            "executed_at": datetime.now(),
+            "executed_at": executed_at,
+            "executed_at_iso": executed_at.isoformat(),
             "success": agent_result.get("success", False)
         }
         
         # Add step result to workflow
-        workflow["step_results"].append(step_result)
-        workflow["current_step"] = step_index + 1
+        workflow.step_results.append(step_result)
+        workflow.current_step = step_index + 1
+        if step_result["success"]:
+            workflow.completed_steps += 1
+        else:
+            workflow.failed_steps += 1
+        
+        # Each step's duration runs from the previous step (or workflow creation)
+        previous_step_at = workflow.last_step_at or workflow.created_at
+        workflow.sum_step_duration += (step_result["executed_at"] - previous_step_at).total_seconds()
+        workflow.last_step_at = step_result["executed_at"]
         
         # Check if workflow is complete
-        if workflow["current_step"] >= len(workflow["steps"]):
-            workflow["status"] = TaskStatus.COMPLETED.value
-            workflow["completed_at"] = datetime.now()
+        if workflow.current_step >= len(workflow.steps):
+            workflow.status = TaskStatus.COMPLETED.value
+            workflow.completed_at = datetime.now()
+            # Re-insert so the record stays in completion order when a step is re-run
+            self._completed_at.pop(task_id, None)
+            self._completed_at[task_id] = workflow.completed_at
             
             # Store workflow result in memory
             await self._store_workflow_result(task_id, workflow)
@@ -102,18 +191,22 @@ class TaskManager:
         
         return step_result
     
-    async def check_task_dependencies(self, task_id: int) -> Dict[str, Any]:
-        """Check if task dependencies are satisfied."""
+    async def check_task_dependencies(self, task_id: int,
+                                      tasks_map: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Check if task dependencies are satisfied, using preloaded dependency tasks when given."""
         
         dependencies = self.task_dependencies.get(task_id, [])
         if not dependencies:
             return {"satisfied": True, "pending_dependencies": []}
         
+        if tasks_map is None:
+            tasks_map = await db_service.get_tasks_by_ids(dependencies)
+        
         pending_dependencies = []
         
         for dep_task_id in dependencies:
-            dep_task = await db_service.get_task(dep_task_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED.value:
+            dep_task = tasks_map.get(dep_task_id)
+            if not dep_task or dep_task["status"] != TaskStatus.COMPLETED.value:
                 pending_dependencies.append(dep_task_id)
         
         return {
@@ -138,27 +231,27 @@ class TaskManager:
                 }
             return {"error": f"Task {task_id} not found"}
         
-        total_steps = len(workflow["steps"])
-        completed_steps = len([r for r in workflow["step_results"] if r["success"]])
-        failed_steps = len([r for r in workflow["step_results"] if not r["success"]])
+        total_steps = len(workflow.steps)
+        completed_steps = workflow.completed_steps
+        failed_steps = workflow.failed_steps
         
         progress_percentage = (completed_steps / total_steps * 100) if total_steps > 0 else 0
         
         # Check timeout
-        is_timed_out = datetime.now() > self.task_timeouts.get(task_id, datetime.max)
+        is_timed_out = datetime.now() > workflow.timeout_at
         
         return {
             "task_id": task_id,
-            "status": workflow["status"],
+            "status": workflow.status,
             "progress_percentage": progress_percentage,
-            "current_step": workflow["current_step"],
+            "current_step": workflow.current_step,
             "total_steps": total_steps,
             "completed_steps": completed_steps,
             "failed_steps": failed_steps,
-            "step_results": workflow["step_results"],
+            "step_results": workflow.step_results,
             "has_workflow": True,
-            "created_at": workflow["created_at"].isoformat(),
-            "timeout_at": self.task_timeouts.get(task_id, datetime.max).isoformat(),
+            "created_at": workflow.created_at_iso,
+            "timeout_at": workflow.timeout_at_iso,
             "is_timed_out": is_timed_out,
             "estimated_completion": self._estimate_completion_time(workflow)
         }
@@ -167,9 +260,9 @@ class TaskManager:
         """Pause task execution."""
         
         workflow = self.task_workflows.get(task_id)
-        if workflow and workflow["status"] == TaskStatus.IN_PROGRESS.value:
-            workflow["status"] = TaskStatus.PAUSED.value
-            workflow["paused_at"] = datetime.now()
+        if workflow and workflow.status == TaskStatus.IN_PROGRESS.value:
+            workflow.status = TaskStatus.PAUSED.value
+            workflow.paused_at = datetime.now()
             
             await db_service.update_task_status(task_id, TaskStatus.PAUSED.value)
             
@@ -181,9 +274,9 @@ class TaskManager:
         """Resume paused task execution."""
         
         workflow = self.task_workflows.get(task_id)
-        if workflow and workflow["status"] == TaskStatus.PAUSED.value:
-            workflow["status"] = TaskStatus.IN_PROGRESS.value
-            workflow["resumed_at"] = datetime.now()
+        if workflow and workflow.status == TaskStatus.PAUSED.value:
+            workflow.status = TaskStatus.IN_PROGRESS.value
+            workflow.resumed_at = datetime.now()
             
             await db_service.update_task_status(task_id, TaskStatus.IN_PROGRESS.value)
             
@@ -194,48 +287,53 @@ class TaskManager:
     async def get_task_timeline(self, task_id: int) -> List[Dict[str, Any]]:
         """Get timeline of task execution events."""
         
-        timeline = []
-        
-        # Get task logs from database
+        # Get task logs from database, already ordered by timestamp
         logs = await db_service.get_task_logs(task_id)
-        for log in logs:
-            timeline.append({
+        log_events = [
+            {
                 "timestamp": log.timestamp.isoformat(),
                 "event_type": "log",
                 "level": log.level,
                 "message": log.message,
-                "metadata": log.metadata
-            })
+                "metadata": log.log_metadata
+            }
+            for log in logs
+        ]
         
-        # Add workflow events if available
+        # Add workflow events if available; steps are recorded in execution order
+        workflow_events = []
         workflow = self.task_workflows.get(task_id)
         if workflow:
-            timeline.append({
-                "timestamp": workflow["created_at"].isoformat(),
+            workflow_events.append({
+                "timestamp": workflow.created_at_iso,
                 "event_type": "workflow_created",
-                "message": f"Workflow created with {len(workflow['steps'])} steps"
+                "message": f"Workflow created with {len(workflow.steps)} steps"
             })
             
-            for step_result in workflow["step_results"]:
-                timeline.append({
-                    "timestamp": step_result["executed_at"].isoformat(),
+            for step_result in workflow.step_results:
+                workflow_events.append({
+                    "timestamp": step_result["executed_at_iso"],
                     "event_type": "step_completed",
                     "step_name": step_result["step_name"],
                     "success": step_result["success"],
                     "message": f"Step '{step_result['step_name']}' {'completed' if step_result['success'] else 'failed'}"
                 })
         
-        # Sort by timestamp
-        timeline.sort(key=lambda x: x["timestamp"])
-        
-        return timeline
+        # Merge the two sorted event streams by timestamp
+        return list(heapq.merge(log_events, workflow_events, key=lambda x: x["timestamp"]))
     
     async def optimize_task_scheduling(self) -> Dict[str, Any]:
         """Optimize scheduling of pending tasks based on dependencies and priorities."""
         
         # Get all pending tasks
-        pending_tasks = await db_service.get_recent_tasks(limit=100)
-        pending_tasks = [t for t in pending_tasks if t.status == TaskStatus.PENDING.value]
+        pending_tasks = await db_service.get_pending_tasks()
+        
+        # Load every dependency of the pending tasks in one query
+        all_dep_ids = {d for t in pending_tasks for d in self.task_dependencies.get(t["id"], [])}
+        tasks_map = await db_service.get_tasks_by_ids(list(all_dep_ids))
+        
+        # Only slots not held by running tasks can take new work
+        free_slots = self.admission.available
         
         # Create scheduling plan
         scheduling_plan = {
@@ -246,22 +344,22 @@ class TaskManager:
         }
         
         for task in pending_tasks:
-            task_id = task.id
+            task_id = task["id"]
             
             # Check dependencies
-            dep_check = await self.check_task_dependencies(task_id)
+            dep_check = await self.check_task_dependencies(task_id, tasks_map)
             
             if dep_check["satisfied"]:
-                if len(scheduling_plan["immediate_execution"]) < self.max_concurrent_tasks:
+                if len(scheduling_plan["immediate_execution"]) < free_slots:
                     scheduling_plan["immediate_execution"].append({
                         "task_id": task_id,
-                        "priority": task.priority,
-                        "created_at": task.created_at.isoformat()
+                        "priority": task["priority"],
+                        "created_at": task["created_at"].isoformat()
                     })
                 else:
                     scheduling_plan["resource_limited"].append({
                         "task_id": task_id,
-                        "priority": task.priority,
+                        "priority": task["priority"],
                         "reason": "Max concurrent tasks reached"
                     })
             else:
@@ -273,7 +371,7 @@ class TaskManager:
         # Add recommendations
         if len(scheduling_plan["resource_limited"]) > 0:
             scheduling_plan["recommendations"].append(
-                "Consider increasing max_concurrent_tasks to handle more tasks simultaneously"
+                "Consider raising the limit with orchestrator.set_max_concurrent_tasks to handle more tasks simultaneously"
             )
         
         if len(scheduling_plan["dependency_waiting"]) > 0:
@@ -283,31 +381,21 @@ class TaskManager:
         
         return scheduling_plan
     
-    def _estimate_completion_time(self, workflow: Dict[str, Any]) -> Optional[str]:
+    def _estimate_completion_time(self, workflow: Workflow) -> Optional[str]:
         """Estimate when the workflow will complete."""
         
-        if workflow["status"] == TaskStatus.COMPLETED.value:
-            return workflow.get("completed_at", datetime.now()).isoformat()
+        if workflow.status == TaskStatus.COMPLETED.value:
+            return (workflow.completed_at or datetime.now()).isoformat()
         
-        completed_steps = len([r for r in workflow["step_results"] if r["success"]])
-        total_steps = len(workflow["steps"])
+        completed_steps = workflow.completed_steps
+        total_steps = len(workflow.steps)
         
         if completed_steps == 0:
             return None
         
         # Calculate average time per step
-        step_times = []
-        for i, result in enumerate(workflow["step_results"]):
-            if i == 0:
-                start_time = workflow["created_at"]
-            else:
-                start_time = workflow["step_results"][i-1]["executed_at"]
-            
-            duration = (result["executed_at"] - start_time).total_seconds()
-            step_times.append(duration)
-        
-        if step_times:
-            avg_step_time = sum(step_times) / len(step_times)
+        if workflow.step_results:
+            avg_step_time = workflow.sum_step_duration / len(workflow.step_results)
             remaining_steps = total_steps - completed_steps
             estimated_remaining_seconds = remaining_steps * avg_step_time
             
@@ -316,15 +404,15 @@ class TaskManager:
         
         return None
     
-    async def _store_workflow_result(self, task_id: int, workflow: Dict[str, Any]):
+    async def _store_workflow_result(self, task_id: int, workflow: Workflow):
         """Store completed workflow result in memory."""
         
         workflow_summary = {
             "task_id": task_id,
-            "total_steps": len(workflow["steps"]),
-            "successful_steps": len([r for r in workflow["step_results"] if r["success"]]),
-            "execution_time": (workflow["completed_at"] - workflow["created_at"]).total_seconds(),
-            "step_results": workflow["step_results"]
+            "total_steps": len(workflow.steps),
+            "successful_steps": workflow.completed_steps,
+            "execution_time": (workflow.completed_at - workflow.created_at).total_seconds(),
+            "step_results": workflow.step_results
         }
         
         await memory_service.store_memory(
@@ -339,13 +427,15 @@ class TaskManager:
         
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
         
+        # Completion times are recorded in completion order, so stop at the first recent one
         workflows_to_remove = []
-        for task_id, workflow in self.task_workflows.items():
-            if (workflow["status"] == TaskStatus.COMPLETED.value and 
-                workflow.get("completed_at", datetime.now()) < cutoff_time):
-                workflows_to_remove.append(task_id)
+        for task_id, completed_at in self._completed_at.items():
+            if completed_at >= cutoff_time:
+                break
+            workflows_to_remove.append(task_id)
         
         for task_id in workflows_to_remove:
+            del self._completed_at[task_id]
             del self.task_workflows[task_id]
             if task_id in self.task_timeouts:
                 del self.task_timeouts[task_id]
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,7 +17,7 @@ class Task(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     user_input = Column(Text, nullable=False)
-    status = Column(String(50), default="pending")  # pending, in_progress, completed, failed
+    status = Column(String(50), default="pending", index=True)  # pending, in_progress, completed, failed
     priority = Column(String(20), default="medium")  # low, medium, high
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -75,6 +75,7 @@ class TaskLog(Base):
     """Task log model for detailed execution tracking."""
     
     __tablename__ = "task_logs"
+    __table_args__ = (Index("ix_tasklog_task_ts", "task_id", "timestamp"),)
     
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
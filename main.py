@@ -10,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 
-from config.settings import settings
+from config.settings import get_settings
 from core.orchestrator import orchestrator
 from core.agent_factory import agent_factory
 from tools.tool_registry import tool_registry
@@ -18,6 +18,8 @@ from tools.default_tools import register_default_tools
 from services.database_service import db_service
 from services.memory_service import memory_service
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
@@ -89,6 +91,9 @@ async def lifespan(app: FastAPI):
     register_default_tools(tool_registry)
     logger.info("Registered default tools")
     
+    # Build the agent factory's templates and tool mappings now that the registry is populated
+    agent_factory.prewarm()
+    
     # Initialize services
     try:
         # Test database connection
@@ -98,6 +103,9 @@ async def lifespan(app: FastAPI):
         # Initialize memory service
         logger.info("Memory service initialized")
         
+        # Plan and queue tasks a previous run left pending
+        await orchestrator.recover_pending_tasks()
+        
         logger.info("EUNA MVP application started successfully")
         
     except Exception as e:
@@ -1,27 +1,48 @@
 """Database service for EUNA MVP."""
 
 import logging
-from typing import Optional, List, Dict, Any
-from sqlalchemy import create_engine, select
+import time
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import case, create_engine, insert, select, update
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import asynccontextmanager
 
-from config.settings import settings
+from config.settings import get_settings
 from database.models import Base, Task, Agent, AgentExecution, TaskLog, UserSession, MemoryEntry
 
 logger = logging.getLogger(__name__)
 
+# Scheduling order of task priorities; unknown priorities rank as medium
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+
+@dataclass(frozen=True, slots=True)
+class AgentRow:
+    """Immutable snapshot of the agent columns needed to execute an agent."""
+    id: int
+    name: str
+    agent_type: str
+    prompt_template: Optional[str]
+    capabilities: Tuple[str, ...]
+
 
 class DatabaseService:
     """Database service for managing SQLite operations."""
     
+    # Agent row cache bounds used by get_agent_row
+    AGENT_CACHE_TTL = 600.0
+    AGENT_CACHE_SIZE = 1024
+    
     def __init__(self):
+        settings = get_settings()
         self.engine = create_engine(
             settings.database_url,
             connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
         )
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self._agent_cache: Dict[int, Tuple[float, AgentRow]] = {}  # agent_id -> (expires_at, row)
         self._create_tables()
     
     def _create_tables(self):
@@ -75,6 +96,51 @@ class DatabaseService:
         async with self.get_session() as session:
             return session.get(Task, task_id)
     
+    async def get_task_bundle(self, task_id: int, log_limit: Optional[int] = 10) -> Dict[str, Any]:
+        """Get a task with its agents and latest logs as plain dicts, using one session."""
+        async with self.get_session() as session:
+            task = session.get(Task, task_id)
+            if task is None:
+                return {"task": None, "agents": [], "logs": []}
+            
+            agents = session.execute(select(Agent).where(Agent.task_id == task_id)).scalars()
+            
+            if log_limit is None:
+                logs = list(session.execute(self._task_logs_stmt(task_id)).scalars())
+            else:
+                # Take the newest entries in SQL, then restore chronological order
+                logs = list(session.execute(self._task_logs_stmt(task_id, log_limit, "desc")).scalars())
+                logs.reverse()
+            
+            return {
+                "task": {
+                    "status": task.status,
+                    "user_input": task.user_input,
+                    "result": task.result,
+                    "error_message": task.error_message,
+                    "created_at": task.created_at,
+                    "updated_at": task.updated_at,
+                    "completed_at": task.completed_at
+                },
+                "agents": [
+                    {
+                        "name": agent.name,
+                        "type": agent.agent_type,
+                        "status": agent.status,
+                        "role": agent.role
+                    }
+                    for agent in agents
+                ],
+                "logs": [
+                    {
+                        "timestamp": log.timestamp.isoformat(),
+                        "level": log.level,
+                        "message": log.message
+                    }
+                    for log in logs
+                ]
+            }
+    
     async def update_task_status(self, task_id: int, status: str, result: Optional[Dict] = None, error_message: Optional[str] = None):
         """Update task status and result."""
         async with self.get_session() as session:
@@ -90,6 +156,80 @@ class DatabaseService:
                     task.completed_at = datetime.utcnow()
                 logger.info(f"Updated task {task_id} status to {status}")
     
+    async def complete_task(self, task_id: int, status: str, result: Optional[Dict] = None,
+                            error_message: Optional[str] = None, log_rows: Optional[List[Dict[str, Any]]] = None):
+        """Set a task's status and write its log rows in a single transaction."""
+        values = {"status": status}
+        if result:
+            values["result"] = result
+        if error_message:
+            values["error_message"] = error_message
+        if status == "completed":
+            from datetime import datetime
+            values["completed_at"] = datetime.utcnow()
+        
+        async with self.get_session() as session:
+            session.execute(update(Task).where(Task.id == task_id).values(**values))
+            if log_rows:
+                session.execute(insert(TaskLog), log_rows)
+            logger.info(f"Updated task {task_id} status to {status}")
+    
+    async def pop_next_batch(self, limit: int, task_ids: List[int]) -> List[int]:
+        """Atomically move up to `limit` of the given pending tasks to in_progress; return their ids by priority."""
+        priority_rank = case(_PRIORITY_RANK, value=Task.priority, else_=1)
+        candidates = (
+            select(Task.id)
+            .where(Task.status == "pending", Task.id.in_(task_ids))
+            .order_by(priority_rank, Task.id)
+            .limit(limit)
+        )
+        async with self.get_session() as session:
+            claimed = session.execute(
+                update(Task)
+                .where(Task.id.in_(candidates.scalar_subquery()))
+                .values(status="in_progress")
+                .returning(Task.id, Task.priority)
+                .execution_options(synchronize_session=False)
+            ).all()
+        
+        return [
+            task_id for task_id, priority in sorted(claimed, key=lambda row: (_PRIORITY_RANK.get(row[1], 1), row[0]))
+        ]
+    
+    async def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get the status columns of several tasks in one query, keyed by task id."""
+        if not task_ids:
+            return {}
+        async with self.get_session() as session:
+            rows = session.execute(
+                select(Task.id, Task.status, Task.priority, Task.created_at).where(Task.id.in_(task_ids))
+            ).all()
+            return {
+                row.id: {"id": row.id, "status": row.status, "priority": row.priority, "created_at": row.created_at}
+                for row in rows
+            }
+    
+    async def get_pending_tasks(self, limit: int = 500) -> List[Dict[str, Any]]:
+        """Get pending tasks, highest priority and oldest first."""
+        priority_rank = case(_PRIORITY_RANK, value=Task.priority, else_=1)
+        async with self.get_session() as session:
+            rows = session.execute(
+                select(Task.id, Task.user_input, Task.status, Task.priority, Task.created_at)
+                .where(Task.status == "pending")
+                .order_by(priority_rank, Task.created_at)
+                .limit(limit)
+            ).all()
+            return [
+                {
+                    "id": row.id,
+                    "user_input": row.user_input,
+                    "status": row.status,
+                    "priority": row.priority,
+                    "created_at": row.created_at
+                }
+                for row in rows
+            ]
+    
     async def get_recent_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent tasks."""
         async with self.get_session() as session:
@@ -145,12 +285,73 @@ class DatabaseService:
             }
 
     
+    @staticmethod
+    def _agent_columns_stmt(agent_id: int):
+        """SELECT of only the agent columns needed for execution."""
+        return select(
+            Agent.id, Agent.name, Agent.agent_type, Agent.prompt_template, Agent.capabilities
+        ).where(Agent.id == agent_id)
+    
+    async def get_agent_row(self, agent_id: int) -> Optional[AgentRow]:
+        """Get an immutable agent snapshot, cached for AGENT_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._agent_cache.get(agent_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        async with self.get_session() as session:
+            r = session.execute(self._agent_columns_stmt(agent_id)).one_or_none()
+            if r is None:
+                return None
+            row = AgentRow(
+                id=r.id,
+                name=r.name,
+                agent_type=r.agent_type,
+                prompt_template=r.prompt_template,
+                capabilities=tuple(r.capabilities or ())
+            )
+        
+        cache = self._agent_cache
+        cache.pop(agent_id, None)
+        if len(cache) >= self.AGENT_CACHE_SIZE:
+            # Evict the oldest insertion
+            del cache[next(iter(cache))]
+        cache[agent_id] = (now + self.AGENT_CACHE_TTL, row)
+        return row
+    
     async def get_task_agents(self, task_id: int) -> List[Agent]:
         """Get all agents for a task."""
         async with self.get_session() as session:
             stmt = select(Agent).where(Agent.task_id == task_id)
             return list(session.execute(stmt).scalars())
     
+    async def get_active_agents_for_tasks(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get the active agents of several tasks with a single query."""
+        async with self.get_session() as session:
+            stmt = select(Agent).where(Agent.task_id.in_(task_ids), Agent.status == "active")
+            return [
+                {
+                    "agent_id": agent.id,
+                    "task_id": agent.task_id,
+                    "name": agent.name,
+                    "type": agent.agent_type,
+                    "role": agent.role,
+                    "created_at": agent.created_at.isoformat()
+                }
+                for agent in session.execute(stmt).scalars()
+            ]
+    
+    async def cancel_active_agents_for_task(self, task_id: int) -> int:
+        """Mark all of a task's active agents cancelled with one UPDATE; return how many changed."""
+        async with self.get_session() as session:
+            result = session.execute(
+                update(Agent)
+                .where(Agent.task_id == task_id, Agent.status == "active")
+                .values(status="cancelled")
+            )
+            logger.info(f"Cancelled {result.rowcount} active agents for task {task_id}")
+            return result.rowcount
+    
     async def update_agent_status(self, agent_id: int, status: str):
         """Update agent status."""
         async with self.get_session() as session:
@@ -162,6 +363,16 @@ class DatabaseService:
                     agent.completed_at = datetime.utcnow()
                 logger.info(f"Updated agent {agent_id} status to {status}")
     
+    async def finalize_agent(self, agent_id: int, status: str):
+        """Record an agent's terminal status with a single UPDATE statement."""
+        values = {"status": status}
+        if status == "completed":
+            from datetime import datetime
+            values["completed_at"] = datetime.utcnow()
+        async with self.get_session() as session:
+            session.execute(update(Agent).where(Agent.id == agent_id).values(**values))
+            logger.info(f"Finalized agent {agent_id} with status {status}")
+    
     # Agent execution operations
     async def create_agent_execution(self, agent_id: int, action: str, input_data: Optional[Dict] = None) -> AgentExecution:
         """Create a new agent execution."""
@@ -209,11 +420,29 @@ class DatabaseService:
             session.add(log_entry)
             logger.debug(f"Added log for task {task_id}: {message}")
     
-    async def get_task_logs(self, task_id: int) -> List[TaskLog]:
-        """Get all logs for a task."""
+    async def add_task_logs_bulk(self, rows: List[Dict[str, Any]]):
+        """Add many log entries with a single multi-row INSERT."""
+        if not rows:
+            return
         async with self.get_session() as session:
-            stmt = select(TaskLog).where(TaskLog.task_id == task_id).order_by(TaskLog.timestamp)
-            return list(session.execute(stmt).scalars())
+            session.execute(insert(TaskLog), rows)
+            logger.debug(f"Added {len(rows)} buffered task logs")
+    
+    @staticmethod
+    def _task_logs_stmt(task_id: int, limit: Optional[int] = None, order: str = "asc"):
+        """SELECT of a task's logs by timestamp, optionally limited."""
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid log order: {order}")
+        timestamp = TaskLog.timestamp.desc() if order == "desc" else TaskLog.timestamp
+        stmt = select(TaskLog).where(TaskLog.task_id == task_id).order_by(timestamp)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+    
+    async def get_task_logs(self, task_id: int, limit: Optional[int] = None, order: str = "asc") -> List[TaskLog]:
+        """Get logs for a task, optionally only the first `limit` in the given timestamp order."""
+        async with self.get_session() as session:
+            return list(session.execute(self._task_logs_stmt(task_id, limit, order)).scalars())
     
     # Session operations
     async def create_or_update_session(self, session_id: str, user_preferences: Optional[Dict] = None, 
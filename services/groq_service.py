@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Any
 from groq import Groq
 import json
 
-from config.settings import settings
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,7 @@ class GroqService:
     """Service for interacting with GROQ LLM API."""
     
     def __init__(self):
+        settings = get_settings()
         if settings.groq_api_key:
             self.client = Groq(api_key=settings.groq_api_key)
         else:
@@ -49,7 +50,8 @@ Respond in JSON format with this structure:
             "type": "default|dynamic", 
             "role": "specific role description",
             "capabilities": ["capability1", "capability2"],
-            "priority": "high|medium|low"
+            "priority": "high|medium|low",
+            "depends_on": ["names of agents whose output this agent needs"]
         }
     ],
     "required_tools": ["tool1", "tool2"],
@@ -153,8 +155,9 @@ Make this agent highly specialized for the specific task requirements."""
             }
     
     async def execute_agent_reasoning(self, agent_prompt: str, task_input: str, 
-                                    context: Optional[Dict] = None, tools_available: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Execute agent reasoning and decision making."""
+                                    context: Optional[Dict] = None, tools_available: Optional[List[str]] = None,
+                                    context_json: Optional[str] = None) -> Dict[str, Any]:
+        """Execute agent reasoning and decision making; context_json is used as-is when given."""
         
         system_prompt = f"""{agent_prompt}
 
@@ -177,7 +180,9 @@ Respond in JSON format:
 }}"""
         
         user_prompt = f"Task Input: {task_input}"
-        if context:
+        if context_json is not None:
+            user_prompt += f"\nContext: {context_json}"
+        elif context:
             user_prompt += f"\nContext: {json.dumps(context, indent=2)}"
         
         try:
@@ -199,7 +204,8 @@ Respond in JSON format:
                 "tools_needed": [],
                 "expected_outcome": "Error handling",
                 "confidence_level": "low",
-                "next_steps": ["retry_or_escalate"]
+                "next_steps": ["retry_or_escalate"],
+                "fallback": True
             }
     
     async def synthesize_results(self, agent_results: List[Dict], original_task: str) -> Dict[str, Any]:
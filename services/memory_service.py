@@ -15,7 +15,7 @@ except ImportError:
     PINECONE_AVAILABLE = False
     logging.warning("Pinecone not available, using fallback memory service")
 
-from config.settings import settings
+from config.settings import get_settings
 from services.database_service import db_service
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,7 @@ class MemoryService:
         self.index = None
         self.dimension = 1024  # Standard embedding dimension
         self.fallback_memory = {}  # In-memory fallback
+        settings = get_settings()
         
         if PINECONE_AVAILABLE and settings.pinecone_api_key:
             try:
@@ -43,6 +44,7 @@ class MemoryService:
         if not PINECONE_AVAILABLE:
             return
             
+        settings = get_settings()
         try:
             # Initialize Pinecone
             pc = Pinecone(api_key=settings.pinecone_api_key)
@@ -182,15 +184,16 @@ class MemoryService:
             logger.error(f"Error searching memory: {e}")
             return []
     
-    async def get_context_for_task(self, task_description: str, task_id: Optional[int] = None) -> Dict[str, Any]:
-        """Get relevant context for a task from memory."""
+    async def get_context_for_task(self, task_description: str, task_id: Optional[int] = None,
+                                   include_task_memories: bool = False) -> Dict[str, Any]:
+        """Get relevant context for a task from memory; task memories need a task_id or include_task_memories."""
         
         # Search for relevant memories
         relevant_memories = await self.search_memory(task_description, limit=10)
         
         # Get task-specific memories if task_id provided
         task_memories = []
-        if task_id:
+        if task_id or include_task_memories:
             task_memories = await self.search_memory(
                 task_description, 
                 content_type="task_result",
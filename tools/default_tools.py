@@ -350,7 +350,7 @@ class DateTimeTool(Tool):
             
             if operation == "now":
                 return {
-                    "current_datetime": now.isoformat(),
+                    "current_datetime": now.replace(microsecond=0).isoformat(),
                     "current_date": now.date().isoformat(),
                     "current_time": now.time().isoformat(),
                     "timestamp": now.timestamp(),
@@ -1,6 +1,7 @@
 """Tool registry system for EUNA MVP."""
 
 import logging
+from functools import cached_property
 from typing import Dict, List, Any, Callable, Optional
 from abc import ABC, abstractmethod
 import asyncio
@@ -44,10 +45,13 @@ class ToolRegistry:
             "file_operations": [],
             "general": []
         }
+        self.revision = 0  # Bumped on every registration so callers can key caches on it
     
     def register_tool(self, tool: Tool, category: str = "general"):
         """Register a tool in the registry."""
         self.tools[tool.name] = tool
+        self.revision += 1
+        self.__dict__.pop("tool_names", None)  # Invalidate the cached name set
         if category in self.tool_categories:
             self.tool_categories[category].append(tool.name)
         else:
@@ -55,6 +59,11 @@ class ToolRegistry:
         
         logger.info(f"Registered tool: {tool.name} in category: {category}")
     
+    @cached_property
+    def tool_names(self) -> frozenset:
+        """Names of all registered tools."""
+        return frozenset(self.tools)
+    
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
         return self.tools.get(name)